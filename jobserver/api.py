@@ -15,7 +15,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .emails import send_finished_notification
-from .models import Backend, JobRequest, Stats, User, Workspace
+from .models import Backend, Job, JobRequest, Stats, User, Workspace
 from .releases import handle_release
 
 
@@ -86,28 +86,35 @@ class JobAPIUpdate(APIView):
         serializer = self.serializer_class(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
 
-        incoming_job_request_ids = {j["job_request_id"] for j in serializer.data}
+        # work from the validated data, rather than serializer.data, since we
+        # only write it to the database.  This skips converting it back into
+        # its serialized form and gives us datetimes rather than strings for
+        # the timestamp fields.
+        incoming_jobs = serializer.validated_data
 
-        # error if we find JobRequest IDs in the payload which aren't in the database.
-        job_request_ids = set(JobRequest.objects.values_list("identifier", flat=True))
-        missing_ids = incoming_job_request_ids - job_request_ids
-        if missing_ids:
-            raise ValidationError(f"Unknown JobRequest IDs: {', '.join(missing_ids)}")
+        incoming_job_request_ids = {j["job_request_id"] for j in incoming_jobs}
 
-        # get JobRequest instances based on the identifiers in the payload
+        # get JobRequest instances based on the identifiers in the payload,
+        # only loading the fields we use below so we don't pull potentially
+        # large fields, such as project_definition, out of the database.
         job_requests = JobRequest.objects.filter(
             identifier__in=incoming_job_request_ids
-        )
+        ).only("created_by", "identifier", "will_notify", "workspace")
         job_request_lut = {jr.identifier: jr for jr in job_requests}
 
+        # error if we find JobRequest IDs in the payload which aren't in the
+        # database.  We only look up the IDs we've been sent rather than
+        # loading every JobRequest identifier to check against.
+        missing_ids = incoming_job_request_ids - job_request_lut.keys()
+        if missing_ids:
+            raise ValidationError(f"Unknown JobRequest IDs: {', '.join(missing_ids)}")
+
         # sort the incoming data by JobRequest identifier to ensure the
         # subsequent groupby call works correctly.
-        job_requests = sorted(
-            serializer.data, key=operator.itemgetter("job_request_id")
-        )
+        incoming_jobs = sorted(incoming_jobs, key=operator.itemgetter("job_request_id"))
         # group Jobs by their JobRequest ID
         jobs_by_request = itertools.groupby(
-            serializer.data, key=operator.itemgetter("job_request_id")
+            incoming_jobs, key=operator.itemgetter("job_request_id")
         )
         for jr_identifier, jobs in jobs_by_request:
             jobs = list(jobs)
@@ -137,23 +144,26 @@ class JobAPIUpdate(APIView):
                 )
                 job_request.jobs.filter(identifier__in=identifiers_to_delete).delete()
 
+            # new Jobs keyed on their identifier, so a Job repeated in the
+            # payload is only inserted once, with the values from its last
+            # entry, as updating it one entry at a time would leave it
+            new_jobs = {}
             for job_data in jobs:
                 # remove this value from the data, it's going to be set by
-                # creating/updating Job instances via the JobRequest instances
-                # related Jobs manager (ie job_request.jobs)
+                # creating/updating Job instances via the JobRequest instance
                 job_data.pop("job_request_id")
 
-                job, created = job_request.jobs.get_or_create(
-                    identifier=job_data["identifier"],
-                    defaults={**job_data},
-                )
-                log.info("Created or updated Job", job=job.id, created=created)
+                job = jobs_by_identifier.get(job_data["identifier"])
 
-                if created:
+                if job is None:
                     # this is the first time job-server has heard about this
                     # Job so we can move on to further Jobs.  We're knowingly
                     # skipping potential notifications here to avoid creating
-                    # false positives.
+                    # false positives.  New Jobs are created in bulk once
+                    # we've looked at the whole payload for this JobRequest.
+                    new_jobs[job_data["identifier"]] = Job(
+                        job_request=job_request, **job_data
+                    )
                     continue
 
                 # check to see if the Job is about to transition to finished
@@ -164,11 +174,20 @@ class JobAPIUpdate(APIView):
                 )
 
                 # update Job "manually" so we can make the check above for
-                # status transition
+                # status transition, only writing the fields which changed
+                changed_fields = []
                 for key, value in job_data.items():
-                    setattr(job, key, value)
-                job.save()
-                job.refresh_from_db()
+                    if getattr(job, key) != value:
+                        setattr(job, key, value)
+                        changed_fields.append(key)
+
+                if not changed_fields:
+                    # nothing has changed so there's nothing to save or
+                    # notify about
+                    continue
+
+                job.save(update_fields=changed_fields)
+                log.info("Updated Job", job=job.id, fields=changed_fields)
 
                 if not job_request.will_notify:
                     continue
@@ -187,6 +206,12 @@ class JobAPIUpdate(APIView):
                     user_id=job_request.created_by_id,
                 )
 
+            if new_jobs:
+                Job.objects.bulk_create(new_jobs.values())
+                log.info(
+                    f"Created jobs with identifiers: {','.join(new_jobs.keys())}",
+                )
+
         # record use of the API
         update_stats(self.backend, request.path)
 
@@ -197,15 +222,16 @@ class WorkspaceSerializer(serializers.ModelSerializer):
     created_by = serializers.CharField(source="created_by.username", default=None)
 
     class Meta:
-        fields = [
+        fields = (
             "name",
             "repo",
             "branch",
             "db",
             "created_by",
             "created_at",
-        ]
+        )
         model = Workspace
+        read_only_fields = fields
 
 
 class JobRequestAPIList(ListAPIView):
@@ -215,7 +241,7 @@ class JobRequestAPIList(ListAPIView):
         workspace = WorkspaceSerializer()
 
         class Meta:
-            fields = [
+            fields = (
                 "backend",
                 "sha",
                 "identifier",
@@ -225,8 +251,9 @@ class JobRequestAPIList(ListAPIView):
                 "created_by",
                 "created_at",
                 "workspace",
-            ]
+            )
             model = JobRequest
+            read_only_fields = fields
 
     def initial(self, request, *args, **kwargs):
         token = request.META.get("HTTP_AUTHORIZATION")
@@ -251,7 +278,28 @@ class JobRequestAPIList(ListAPIView):
             JobRequest.objects.filter(
                 jobs__completed_at__isnull=True,
             )
-            .select_related("created_by", "workspace", "workspace__created_by")
+            .select_related(
+                "backend", "created_by", "workspace", "workspace__created_by"
+            )
+            # only load the columns serializer_class renders, this avoids
+            # pulling large columns such as project_definition out of the
+            # database for every JobRequest.
+            .only(
+                "backend__name",
+                "cancelled_actions",
+                "created_at",
+                "created_by__username",
+                "force_run_dependencies",
+                "identifier",
+                "requested_actions",
+                "sha",
+                "workspace__branch",
+                "workspace__created_at",
+                "workspace__created_by__username",
+                "workspace__db",
+                "workspace__name",
+                "workspace__repo",
+            )
             .order_by("-created_at")
             .distinct()
         )
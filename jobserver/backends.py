@@ -1,10 +1,8 @@
+import os
 from datetime import timedelta
+from functools import lru_cache
 
 from django.utils import timezone
-from environs import Env
-
-
-env = Env()
 
 
 available_backends = {
@@ -20,10 +18,16 @@ def backends_to_choices(backends):
 
 def get_configured_backends():
     """Get a list of configured Backends from the env"""
-    backends = env.list("BACKENDS", default=[])
+    # BackendManager calls this for every query so parsing is cached against
+    # the raw value, which still lets the env be changed at runtime (eg in
+    # tests)
+    return _parse_backends(os.environ.get("BACKENDS", ""))
+
 
+@lru_cache
+def _parse_backends(value):
     # remove whitespace and only return non-empty strings
-    backends = {u.strip() for u in backends if u}
+    backends = frozenset(b.strip() for b in value.split(",") if b.strip())
 
     unknown = backends - available_backends
     if unknown:
@@ -2,6 +2,7 @@ import functools
 
 import structlog
 from django.conf import settings
+from django.db.models import Max
 from django.urls import reverse
 
 from .authorization import SuperUser, has_role
@@ -22,43 +23,45 @@ def backend_warnings(request):
             return
 
         for backend in backends:
-            try:
-                last_seen = (
-                    backend.stats.order_by("-api_last_seen").first().api_last_seen
-                )
-            except AttributeError:
+            if backend.last_seen is None:
                 logger.info(f"No stats found for backend '{backend.name}'")
                 continue
 
-            if show_warning(last_seen):
+            if show_warning(backend.last_seen):
                 yield backend.display_name
 
-    backends = Backend.objects.all()
+    # get each Backend's most recent API contact in the same query as the
+    # Backends since this runs for every rendered page
+    backends = Backend.objects.annotate(last_seen=Max("stats__api_last_seen"))
     return {"backend_warnings": list(iter_warnings(backends))}
 
 
 def nav(request):
     _active = functools.partial(_is_active, request)
 
+    job_list_url = reverse("job-list")
+    status_url = reverse("status")
+
     options = [
         {
             "name": "Event Log",
-            "is_active": _active(reverse("job-list")),
-            "url": reverse("job-list"),
+            "is_active": _active(job_list_url),
+            "url": job_list_url,
         },
         {
             "name": "Status",
-            "is_active": _active(reverse("status")),
-            "url": reverse("status"),
+            "is_active": _active(status_url),
+            "url": status_url,
         },
     ]
 
     if has_role(request.user, SuperUser):
+        backend_list_url = reverse("backend-list")
         options.append(
             {
                 "name": "Backends",
-                "is_active": _active(reverse("backend-list")),
-                "url": reverse("backend-list"),
+                "is_active": _active(backend_list_url),
+                "url": backend_list_url,
             }
         )
 
@@ -5,7 +5,23 @@ from django import forms
 from .models import JobRequest, Org, Project, ResearcherRegistration, User, Workspace
 
 
+# Crispy doesn't modify a helper without a Layout when rendering a form with
+# it, so forms which only need a Submit button can share this one rather
+# than building their own for every instance.
+submit_helper = FormHelper()
+submit_helper.add_input(Submit("submit", "Submit"))
+
+
 class JobRequestCreateForm(forms.ModelForm):
+    requested_actions = forms.MultipleChoiceField(
+        widget=forms.CheckboxSelectMultiple,
+        error_messages={
+            "required": "Please select at least one of the Actions listed above."
+        },
+    )
+
+    helper = submit_helper
+
     class Meta:
         fields = [
             "force_run_dependencies",
@@ -20,18 +36,9 @@ class JobRequestCreateForm(forms.ModelForm):
 
     def __init__(self, actions, *args, backends=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.add_input(Submit("submit", "Submit"))
-
-        #  add action field based on the actions passed in
-        choices = [(a, a) for a in actions]
-        self.fields["requested_actions"] = forms.MultipleChoiceField(
-            choices=choices,
-            widget=forms.CheckboxSelectMultiple,
-            error_messages={
-                "required": "Please select at least one of the Actions listed above."
-            },
-        )
+
+        # populate the action field's choices from the actions passed in
+        self.fields["requested_actions"].choices = tuple((a, a) for a in actions)
 
         if backends:
             self.fields["backend"] = forms.ChoiceField(
@@ -112,6 +119,12 @@ class WorkspaceArchiveToggleForm(forms.Form):
 
 class WorkspaceCreateForm(forms.ModelForm):
     branch = forms.CharField(widget=forms.Select)
+    repo = forms.ChoiceField(
+        label="Repo",
+        help_text="If your repo doesn't show up here, reach out to the OpenSAFELY team on Slack.",
+    )
+
+    helper = submit_helper
 
     class Meta:
         fields = [
@@ -127,31 +140,26 @@ class WorkspaceCreateForm(forms.ModelForm):
 
     def __init__(self, repos_with_branches, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.add_input(Submit("submit", "Submit"))
 
-        self.repos_with_branches = repos_with_branches
+        # index each repo's branches by its URL, normalising branch names so
+        # we can do a case insensitive match when validating
+        self.branches_by_repo = {
+            r["url"]: {b.lower() for b in r["branches"]} for r in repos_with_branches
+        }
 
-        choices = [(r["url"], r["name"]) for r in self.repos_with_branches]
-        self.fields["repo"] = forms.ChoiceField(
-            label="Repo",
-            choices=choices,
-            help_text="If your repo doesn't show up here, reach out to the OpenSAFELY team on Slack.",
+        self.fields["repo"].choices = tuple(
+            (r["url"], r["name"]) for r in repos_with_branches
         )
 
     def clean_branch(self):
         repo_url = self.cleaned_data["repo"]
         branch = self.cleaned_data["branch"]
 
-        repo = next(
-            filter(lambda r: r["url"] == repo_url, self.repos_with_branches), None
-        )
-        if repo is None:
+        branches = self.branches_by_repo.get(repo_url)
+        if branches is None:
             msg = "Unknown repo, please reload the page and try again"
             raise forms.ValidationError(msg)
 
-        # normalise branch names so we can do a case insensitive match
-        branches = [b.lower() for b in repo["branches"]]
         if branch.lower() not in branches:
             raise forms.ValidationError(f'Unknown branch "{branch}"')
         return branch
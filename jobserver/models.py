@@ -12,7 +12,7 @@ from django.contrib.auth.models import AbstractUser
 from django.core import signing
 from django.core.validators import validate_slug
 from django.db import models, transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Prefetch
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
@@ -181,6 +181,24 @@ class JobRequestQuerySet(models.QuerySet):
     def unacked(self):
         return self.annotate(num_jobs=Count("jobs")).filter(num_jobs=0)
 
+    def with_job_summaries(self):
+        """
+        Prefetch the Jobs of each JobRequest for listing them
+
+        Only the Job columns used to summarise a JobRequest (and its Jobs) in
+        a list are loaded.
+        """
+        jobs = Job.objects.only(
+            "job_request_id",
+            "identifier",
+            "action",
+            "status",
+            "status_message",
+            "started_at",
+            "completed_at",
+        )
+        return self.prefetch_related(Prefetch("jobs", queryset=jobs))
+
 
 class JobRequest(models.Model):
     """
@@ -190,6 +208,10 @@ class JobRequest(models.Model):
     Workspace.  The job-runner will create any required Jobs for the requested
     one to run.  All Jobs, either added by Human or Computer, are then grouped
     by this object.
+
+    Properties derived from the related Jobs work from self.jobs.all() so
+    they use prefetched Jobs, when available, instead of querying per
+    JobRequest.
     """
 
     backend = models.ForeignKey(
@@ -223,15 +245,15 @@ class JobRequest(models.Model):
 
     @property
     def completed_at(self):
-        last_job = self.jobs.order_by("completed_at").last()
-
-        if not last_job:
+        if self.status not in ["failed", "succeeded"]:
             return
 
-        if self.status not in ["failed", "succeeded"]:
+        completed_ats = [j.completed_at for j in self.jobs.all() if j.completed_at]
+
+        if not completed_ats:
             return
 
-        return last_job.completed_at
+        return max(completed_ats)
 
     def get_cancel_url(self):
         return reverse("job-request-cancel", kwargs={"pk": self.pk})
@@ -273,7 +295,7 @@ class JobRequest(models.Model):
         This property finds Jobs with that action so we can easily see if this
         particular request was valid or not.
         """
-        return self.jobs.filter(action="__error__").exists()
+        return any(j.action == "__error__" for j in self.jobs.all())
 
     @property
     def num_completed(self):
@@ -297,7 +319,7 @@ class JobRequest(models.Model):
             return (job.completed_at - job.started_at).total_seconds()
 
         # Only look at jobs which have finished
-        jobs = self.jobs.filter(Q(status="failed") | Q(status="succeeded"))
+        jobs = [j for j in self.jobs.all() if j.is_finished]
         total_runtime = sum(runtime_in_seconds(j) for j in jobs)
 
         hours, remainder = divmod(total_runtime, 3600)
@@ -307,16 +329,16 @@ class JobRequest(models.Model):
 
     @property
     def started_at(self):
-        first_job = self.jobs.exclude(started_at=None).order_by("started_at").first()
+        started_ats = [j.started_at for j in self.jobs.all() if j.started_at]
 
-        if not first_job:
+        if not started_ats:
             return
 
-        return first_job.started_at
+        return min(started_ats)
 
     @property
     def status(self):
-        statuses = self.jobs.values_list("status", flat=True)
+        statuses = [j.status for j in self.jobs.all()]
 
         # when they're all the same, just use that
         if len(set(statuses)) == 1:
@@ -512,9 +534,11 @@ class ProjectInvitation(models.Model):
     def create_membership(self):
         self.accepted_at = timezone.now()
 
+        # use the FK columns directly to avoid fetching the Project and User
+        # just to link the membership to them
         membership = ProjectMembership.objects.create(
-            project=self.project,
-            user=self.user,
+            project_id=self.project_id,
+            user_id=self.user_id,
         )
         self.membership = membership
 
@@ -789,20 +813,17 @@ class Workspace(models.Model):
         Build a lookup table of action -> status
 
         We need to get the latest status for each action run inside this
-        Workspace.
+        Workspace.  Jobs are fetched, oldest first, as (action, status) pairs
+        in a single query so building the dict leaves the latest status for
+        each action.
         """
-        jobs = Job.objects.filter(job_request__workspace=self)
-
-        # get all known actions
-        actions = set(jobs.values_list("action", flat=True))
-
-        action_status_lut = {}
-        for action in actions:
-            # get the latest status for an action
-            job = jobs.filter(action=action).order_by("-created_at").first()
-            action_status_lut[action] = job.status
+        jobs = (
+            Job.objects.filter(job_request__workspace=self)
+            .order_by("created_at", "pk")
+            .values_list("action", "status")
+        )
 
-        return action_status_lut
+        return dict(jobs)
 
     @property
     def repo_name(self):
@@ -98,8 +98,8 @@ class JobRequestList(FormMixin, ListView):
 
     def get_queryset(self):
         qs = (
-            JobRequest.objects.prefetch_related("jobs")
-            .select_related("workspace")
+            JobRequest.objects.with_job_summaries()
+            .select_related("backend", "workspace")
             .order_by("-pk")
         )
 
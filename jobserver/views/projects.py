@@ -26,7 +26,7 @@ class ProjectAcceptInvite(View):
         except (ProjectInvitation.DoesNotExist, signing.BadSignature):
             raise Http404
 
-        if request.user != invite.user:
+        if request.user.pk != invite.user_id:
             messages.error(
                 request,
                 "Only the User who was invited may accept an invite.",
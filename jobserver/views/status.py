@@ -1,3 +1,4 @@
+from django.db.models import Count, Max, Q
 from django.template.response import TemplateResponse
 from django.views.generic import View
 
@@ -14,26 +15,31 @@ class Status(View):
             return last_seen.strftime("%Y-%m-%d %H:%M:%S")
 
         def get_stats(backend):
-            acked = backend.job_requests.acked().count()
-            unacked = backend.job_requests.unacked().count()
-
-            try:
-                last_seen = (
-                    backend.stats.order_by("-api_last_seen").first().api_last_seen
-                )
-            except AttributeError:
-                last_seen = None
-
             return {
                 "name": backend.display_name,
-                "last_seen": format_last_seen(last_seen),
+                "last_seen": format_last_seen(backend.last_seen),
                 "queue": {
-                    "acked": acked,
-                    "unacked": unacked,
+                    "acked": backend.acked,
+                    "unacked": backend.unacked,
                 },
-                "show_warning": show_warning(last_seen),
+                "show_warning": show_warning(backend.last_seen),
             }
 
-        backends = Backend.objects.all()
+        # aggregate each Backend's queue size and API last seen time in the
+        # database so we build this page with one query instead of three per
+        # Backend.  JobRequests are acked once they have Jobs.
+        backends = Backend.objects.annotate(
+            acked=Count(
+                "job_requests",
+                filter=Q(job_requests__jobs__isnull=False),
+                distinct=True,
+            ),
+            unacked=Count(
+                "job_requests",
+                filter=Q(job_requests__jobs__isnull=True),
+                distinct=True,
+            ),
+            last_seen=Max("stats__api_last_seen"),
+        )
         context = {"backends": [get_stats(b) for b in backends]}
         return TemplateResponse(request, "status.html", context)
@@ -244,8 +244,8 @@ class WorkspaceLog(ListView):
     def get_queryset(self):
         qs = (
             JobRequest.objects.filter(workspace=self.workspace)
-            .prefetch_related("jobs")
-            .select_related("workspace")
+            .with_job_summaries()
+            .select_related("backend", "workspace")
             .order_by("-pk")
         )
 
@@ -0,0 +1,5 @@
+$(document).ready(() => {
+  new List('workspace-list', {
+    valueNames: ['name', 'repo'],
+  });
+});
@@ -0,0 +1,3 @@
+$(document).ready(() => {
+  $('#warning-tooltip').tooltip();
+});
@@ -1,10 +1,63 @@
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory
 
 from jobserver.authorization.roles import SuperUser
+from jobserver.models import Backend, Org
 
 from .factories import UserFactory
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """
+    Seed the test database with the rows our data migrations create
+
+    The test database is built from the models with --nomigrations, which is
+    much quicker than running every migration, so the Backends and the
+    DataLab Org our tests expect to exist are created here instead.
+    """
+    with django_db_blocker.unblock():
+        # use the base manager so seeding doesn't depend on BACKENDS in the
+        # environment the tests are run from
+        backends = Backend._base_manager
+        backends.get_or_create(name="emis", display_name="EMIS")
+        backends.get_or_create(name="expectations", display_name="expectations")
+        backends.get_or_create(
+            name="tpp",
+            display_name="TPP",
+            parent_directory="/d/Level4Files/workspaces",
+        )
+
+        Org.objects.get_or_create(name="DataLab", slug="datalab")
+
+
+@pytest.fixture(scope="session")
+def backends(django_db_setup, django_db_blocker):
+    """
+    The seeded Backends, keyed by name
+
+    These are looked up once per session, with one query, and shared between
+    tests so they must not be modified by the tests using them.
+    """
+    with django_db_blocker.unblock():
+        return {b.name: b for b in Backend._base_manager.all()}
+
+
+@pytest.fixture(scope="session")
+def anon_get_request():
+    """
+    A GET request to / from a logged out User, shared between tests
+
+    Only for views which read the request.  Tests which touch the session,
+    messages, or anything else on the request should build their own.
+    """
+    request = RequestFactory().get("/")
+    request.user = AnonymousUser()
+    return request
+
+
 @pytest.fixture
 def api_rf():
     from rest_framework.test import APIRequestFactory
@@ -12,6 +65,40 @@ def api_rf():
     return APIRequestFactory()
 
 
+@pytest.fixture
+def messaged_request(rf):
+    """
+    Build a request which views can add messages to
+
+    Messages are stored on the request so tests can inspect them with
+    list(request._messages).
+    """
+
+    def _build(method, path, data=None, user=None):
+        request = getattr(rf, method)(path, data or {})
+        request.user = user
+
+        # set up messages framework
+        request.session = "session"
+        request._messages = FallbackStorage(request)
+
+        return request
+
+    return _build
+
+
+@pytest.fixture
+def github_membership_forbidden(monkeypatch):
+    """Stub GitHub saying the requesting User isn't in the opensafely org"""
+    monkeypatch.setattr("jobserver.roles.is_member_of_org", lambda org, user: False)
+
+
+@pytest.fixture
+def github_membership_ok(monkeypatch):
+    """Stub GitHub saying the requesting User is in the opensafely org"""
+    monkeypatch.setattr("jobserver.roles.is_member_of_org", lambda org, user: True)
+
+
 @pytest.fixture
 def superuser():
     return UserFactory(roles=[SuperUser])
@@ -134,7 +134,7 @@ class WorkspaceFactory(factory.django.DjangoModelFactory):
         model = Workspace
 
     name = factory.Sequence(lambda n: f"workspace-{n}")
-    repo = factory.Sequence(lambda n: "http://example.com/org-{n}/repo-{n}")
+    repo = factory.Sequence(lambda n: f"http://example.com/org-{n}/repo-{n}")
 
 
 class ReleaseFactory(factory.django.DjangoModelFactory):
@@ -143,3 +143,27 @@ class ReleaseFactory(factory.django.DjangoModelFactory):
 
     backend = factory.SubFactory("tests.factories.BackendFactory")
     workspace = factory.SubFactory("tests.factories.WorkspaceFactory")
+
+
+def bulk_create_jobs(jobs, job_request, **kwargs):
+    """
+    Create Jobs for the given JobRequest with a single INSERT
+
+    JobFactory.create_batch() saves each Job (and any SubFactory parents it
+    builds) one query at a time.  Instead we build the Jobs in memory, all
+    attached to the given JobRequest, and save them together with bulk_create.
+
+    jobs is either the number of Jobs to create, or a list of dicts of field
+    values, one per Job, for when the Jobs need differing values.  Any kwargs
+    are applied to every Job.
+
+    Note: SQLite doesn't give us primary keys back from bulk_create so use
+    JobFactory.create_batch() when the test needs the created Jobs.
+    """
+    if isinstance(jobs, int):
+        jobs = [{}] * jobs
+
+    jobs = [
+        JobFactory.build(job_request=job_request, **{**kwargs, **spec}) for spec in jobs
+    ]
+    Job.objects.bulk_create(jobs, batch_size=100)
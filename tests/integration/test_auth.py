@@ -72,8 +72,7 @@ def test_login_pipeline(client):
     assert response.url == "/"
 
     # ensure we only have one User and it's constructed as expected
-    assert User.objects.count() == 1
-    user = User.objects.first()
+    [user] = User.objects.all()
     assert user.first_name == "Test"
     assert user.last_name == "User"
     assert user.email == "test@example.com"
@@ -1,6 +1,5 @@
 import pytest
 
-from jobserver.models import Backend
 from jobserver.templatetags.status_tools import status_hint
 
 from ...factories import BackendFactory, JobFactory, JobRequestFactory, WorkspaceFactory
@@ -12,8 +11,8 @@ from ...factories import BackendFactory, JobFactory, JobRequestFactory, Workspac
 
 
 @pytest.mark.django_db
-def test_status_hint_dependency_failed():
-    backend = Backend.objects.get(name="tpp")
+def test_status_hint_dependency_failed(backends):
+    backend = backends["tpp"]
     job_request = JobRequestFactory(backend=backend)
     job = JobFactory(job_request=job_request, status_code="dependency_failed")
 
@@ -21,8 +20,8 @@ def test_status_hint_dependency_failed():
 
 
 @pytest.mark.django_db
-def test_status_hint_waiting_on_dependencies():
-    backend = Backend.objects.get(name="tpp")
+def test_status_hint_waiting_on_dependencies(backends):
+    backend = backends["tpp"]
     job_request = JobRequestFactory(backend=backend)
     job = JobFactory(job_request=job_request, status_code="waiting_on_dependencies")
 
@@ -30,8 +29,8 @@ def test_status_hint_waiting_on_dependencies():
 
 
 @pytest.mark.django_db
-def test_status_hint_waiting_on_workers():
-    backend = Backend.objects.get(name="tpp")
+def test_status_hint_waiting_on_workers(backends):
+    backend = backends["tpp"]
     job_request = JobRequestFactory(backend=backend)
     job = JobFactory(job_request=job_request, status_code="waiting_on_workers")
 
@@ -39,8 +38,8 @@ def test_status_hint_waiting_on_workers():
 
 
 @pytest.mark.django_db
-def test_status_hint_nonzero_exit():
-    backend = Backend.objects.get(name="tpp")
+def test_status_hint_nonzero_exit(backends):
+    backend = backends["tpp"]
     workspace = WorkspaceFactory(name="an-workspace")
     job_request = JobRequestFactory(backend=backend, workspace=workspace)
     job = JobFactory(
@@ -65,8 +64,8 @@ def test_status_hint_unknown_backend():
 
 
 @pytest.mark.django_db
-def test_status_hint_unknown_status_code():
-    backend = Backend.objects.get(name="tpp")
+def test_status_hint_unknown_status_code(backends):
+    backend = backends["tpp"]
     job_request = JobRequestFactory(backend=backend)
     job = JobFactory(job_request=job_request)
 
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 from django.conf import settings
+from django.db.models.signals import post_save
 from django.utils import timezone
 from rest_framework.exceptions import NotAuthenticated
 from rest_framework.test import APIClient
@@ -16,7 +17,7 @@ from jobserver.api import (
     update_stats,
 )
 from jobserver.authorization import CoreDeveloper, OrgCoordinator, ProjectDeveloper
-from jobserver.models import Backend, Job, JobRequest, Stats
+from jobserver.models import Job, JobRequest, Stats
 from tests.jobserver.test_releases import make_release_zip
 
 from ..factories import (
@@ -31,6 +32,7 @@ from ..factories import (
     StatsFactory,
     UserFactory,
     WorkspaceFactory,
+    bulk_create_jobs,
 )
 
 
@@ -45,10 +47,10 @@ def test_token_backend_no_token():
 
 
 @pytest.mark.django_db
-def test_token_backend_success(monkeypatch):
+def test_token_backend_success(monkeypatch, backends):
     monkeypatch.setenv("BACKENDS", "tpp")
 
-    tpp = Backend.objects.get(name="tpp")
+    tpp = backends["tpp"]
 
     assert get_backend_from_token(tpp.auth_token) == tpp
 
@@ -67,8 +69,8 @@ def test_update_stats_existing_url():
     update_stats(backend, url="test")
 
     # check there's only one Stats for backend
-    assert backend.stats.count() == 1
-    assert backend.stats.first().url == "test"
+    [stats] = backend.stats.all()
+    assert stats.url == "test"
 
 
 @pytest.mark.django_db
@@ -184,7 +186,7 @@ def test_jobapiupdate_all_new(api_rf):
     backend = BackendFactory()
     job_request = JobRequestFactory()
 
-    assert Job.objects.count() == 0
+    assert not Job.objects.exists()
 
     data = [
         {
@@ -234,11 +236,139 @@ def test_jobapiupdate_all_new(api_rf):
     assert Job.objects.count() == 3
 
 
+@pytest.mark.django_db
+def test_jobapiupdate_interleaved_job_requests(api_rf):
+    backend = BackendFactory()
+    job_request1 = JobRequestFactory()
+    job_request2 = JobRequestFactory()
+
+    def job(identifier, job_request):
+        return {
+            "identifier": identifier,
+            "job_request_id": job_request.identifier,
+            "action": "test-action",
+            "status": "running",
+            "status_code": "",
+            "status_message": "",
+            "created_at": timezone.now() - timedelta(minutes=2),
+            "started_at": timezone.now() - timedelta(minutes=1),
+            "updated_at": timezone.now(),
+            "completed_at": None,
+        }
+
+    # Jobs for the same JobRequest aren't next to each other in the payload
+    data = [
+        job("job1", job_request1),
+        job("job2", job_request2),
+        job("job3", job_request1),
+    ]
+
+    request = api_rf.post(
+        "/", HTTP_AUTHORIZATION=backend.auth_token, data=data, format="json"
+    )
+    response = JobAPIUpdate.as_view()(request)
+
+    assert response.status_code == 200, response.data
+    assert set(job_request1.jobs.values_list("identifier", flat=True)) == {
+        "job1",
+        "job3",
+    }
+    assert set(job_request2.jobs.values_list("identifier", flat=True)) == {"job2"}
+
+
+@pytest.mark.django_db
+def test_jobapiupdate_new_job_repeated_in_payload(api_rf):
+    backend = BackendFactory()
+    job_request = JobRequestFactory()
+
+    def job(status):
+        return {
+            "identifier": "job1",
+            "job_request_id": job_request.identifier,
+            "action": "test-action",
+            "status": status,
+            "status_code": "",
+            "status_message": "",
+            "created_at": timezone.now() - timedelta(minutes=2),
+            "started_at": timezone.now() - timedelta(minutes=1),
+            "updated_at": timezone.now(),
+            "completed_at": None,
+        }
+
+    data = [job("pending"), job("running")]
+
+    request = api_rf.post(
+        "/", HTTP_AUTHORIZATION=backend.auth_token, data=data, format="json"
+    )
+    response = JobAPIUpdate.as_view()(request)
+
+    assert response.status_code == 200, response.data
+
+    # the Job is only created once, with the values from its last entry
+    [job] = job_request.jobs.all()
+    assert job.identifier == "job1"
+    assert job.status == "running"
+
+
+@pytest.mark.django_db
+def test_jobapiupdate_only_writes_changed_jobs(api_rf, freezer):
+    backend = BackendFactory()
+    job_request = JobRequestFactory()
+
+    job_data = {
+        "action": "test-action",
+        "status": "running",
+        "status_code": "",
+        "status_message": "",
+        "created_at": timezone.now() - timedelta(minutes=2),
+        "started_at": timezone.now() - timedelta(minutes=1),
+        "updated_at": timezone.now(),
+        "completed_at": None,
+    }
+    JobFactory(job_request=job_request, identifier="unchanged", **job_data)
+    JobFactory(job_request=job_request, identifier="changed", **job_data)
+
+    data = [
+        {
+            **job_data,
+            "identifier": "unchanged",
+            "job_request_id": job_request.identifier,
+        },
+        {
+            **job_data,
+            "identifier": "changed",
+            "job_request_id": job_request.identifier,
+            "status_message": "test message",
+        },
+    ]
+
+    # record which Jobs are saved, and with which fields
+    saved = []
+
+    def record_save(sender, instance, update_fields, **kwargs):
+        saved.append((instance.identifier, update_fields))
+
+    request = api_rf.post(
+        "/", HTTP_AUTHORIZATION=backend.auth_token, data=data, format="json"
+    )
+    post_save.connect(record_save, sender=Job)
+    try:
+        response = JobAPIUpdate.as_view()(request)
+    finally:
+        post_save.disconnect(record_save, sender=Job)
+
+    assert response.status_code == 200, response.data
+    assert saved == [("changed", frozenset({"status_message"}))]
+
+    job = Job.objects.get(identifier="changed")
+    assert job.status_message == "test message"
+
+
 @pytest.mark.django_db
 def test_jobapiupdate_invalid_payload(api_rf):
     backend = BackendFactory()
 
-    assert Job.objects.count() == 0
+    assert not Job.objects.exists()
 
     data = [{"action": "test-action"}]
 
@@ -247,7 +377,7 @@ def test_jobapiupdate_invalid_payload(api_rf):
     )
     response = JobAPIUpdate.as_view()(request)
 
-    assert Job.objects.count() == 0
+    assert not Job.objects.exists()
 
     assert response.status_code == 400, response.data
 
@@ -463,8 +593,8 @@ def test_jobapiupdate_unknown_job_request(api_rf):
 
 
 @pytest.mark.django_db
-def test_jobrequestapilist_filter_by_backend(api_rf):
-    JobRequestFactory(backend=Backend.objects.get(name="expectations"))
+def test_jobrequestapilist_filter_by_backend(api_rf, backends):
+    JobRequestFactory(backend=backends["expectations"])
     JobRequestFactory(backend=BackendFactory(name="test"))
 
     request = api_rf.get("/?backend=expectations")
@@ -485,7 +615,7 @@ def test_jobrequestapilist_get_only(api_rf):
 def test_jobrequestapilist_produce_stats_when_authed(api_rf):
     backend = BackendFactory()
 
-    assert Stats.objects.filter(backend=backend).count() == 0
+    assert not Stats.objects.filter(backend=backend).exists()
 
     request = api_rf.get("/", HTTP_AUTHORIZATION=backend.auth_token)
     response = JobRequestAPIList.as_view()(request)
@@ -500,16 +630,18 @@ def test_jobrequestapilist_success(api_rf):
 
     # all completed
     job_request1 = JobRequestFactory(workspace=workspace)
-    JobFactory.create_batch(2, job_request=job_request1, completed_at=timezone.now())
+    bulk_create_jobs(2, job_request=job_request1, completed_at=timezone.now())
 
     # some completed
     job_request2 = JobRequestFactory(workspace=workspace)
-    JobFactory(job_request=job_request2, completed_at=timezone.now())
-    JobFactory(job_request=job_request2, completed_at=None)
+    bulk_create_jobs(
+        [{"completed_at": timezone.now()}, {"completed_at": None}],
+        job_request=job_request2,
+    )
 
     # none completed
     job_request3 = JobRequestFactory(workspace=workspace)
-    JobFactory.create_batch(2, job_request=job_request3, completed_at=None)
+    bulk_create_jobs(2, job_request=job_request3, completed_at=None)
 
     #  no jobs
     job_request4 = JobRequestFactory(workspace=workspace)
@@ -531,6 +663,22 @@ def test_jobrequestapilist_success(api_rf):
     }
 
 
+@pytest.mark.django_db
+def test_jobrequestapilist_avoids_n_plus_one_queries(api_rf, django_assert_num_queries):
+    JobRequestFactory.create_batch(5)
+
+    request = api_rf.get("/")
+
+    # one query for the pagination count, one for the page of JobRequests
+    # with their Backend, User and Workspace joined in
+    with django_assert_num_queries(2):
+        response = JobRequestAPIList.as_view()(request)
+        response.render()
+
+    assert response.status_code == 200
+    assert response.data["count"] == 5
+
+
 @pytest.mark.django_db
 def test_userapidetail_success(api_rf):
     backend = BackendFactory()
@@ -44,6 +44,14 @@ def test_get_configured_backends_success(monkeypatch):
     assert backends == {"expectations", "tpp"}
 
 
+def test_get_configured_backends_tracks_env_changes(monkeypatch):
+    monkeypatch.setenv("BACKENDS", "tpp")
+    assert get_configured_backends() == {"tpp"}
+
+    monkeypatch.setenv("BACKENDS", "emis")
+    assert get_configured_backends() == {"emis"}
+
+
 def test_get_configured_backends_unknown_backend(monkeypatch):
     monkeypatch.setenv("BACKENDS", "tpp,test,expectations")
 
@@ -5,17 +5,16 @@ from django.urls import reverse
 from django.utils import timezone
 
 from jobserver.context_processors import backend_warnings, nav
-from jobserver.models import Backend
 
 from ..factories import JobRequestFactory, StatsFactory, UserFactory
 
 
 @pytest.mark.django_db
-def test_backend_warnings_with_debug_on(rf, settings):
+def test_backend_warnings_with_debug_on(rf, settings, backends):
     settings.DEBUG = True
 
     # set up some stats which should show up a warning in normal circumstances
-    tpp = Backend.objects.get(name="tpp")
+    tpp = backends["tpp"]
 
     JobRequestFactory(backend=tpp)
 
@@ -40,8 +39,8 @@ def test_backend_warnings_with_no_warnings(rf):
 
 
 @pytest.mark.django_db
-def test_backend_warnings_with_warnings(rf):
-    tpp = Backend.objects.get(name="tpp")
+def test_backend_warnings_with_warnings(rf, backends):
+    tpp = backends["tpp"]
 
     JobRequestFactory(backend=tpp)
 
@@ -3,8 +3,9 @@ from django.db import connection
 
 from jobserver.authorization import CoreDeveloper, OutputChecker, ProjectCollaborator
 from jobserver.fields import RolesField, _ensure_role_paths, parse_roles
+from jobserver.models import Workspace
 
-from ..factories import OrgFactory, OrgMembershipFactory, UserFactory
+from ..factories import OrgFactory, OrgMembershipFactory, UserFactory, WorkspaceFactory
 
 
 def test_ensure_role_paths_success():
@@ -56,6 +57,17 @@ def test_roles_field_default_empty_list():
     assert UserFactory().roles == []
 
 
+@pytest.mark.django_db
+def test_roles_field_null():
+    WorkspaceFactory(created_by=None)
+
+    # a Workspace without a creator is joined to User with a LEFT OUTER JOIN,
+    # which gives us NULL for each of the User's columns, including roles
+    workspace = Workspace.objects.select_related("created_by").get()
+
+    assert workspace.created_by is None
+
+
 @pytest.mark.django_db
 def test_roles_field_empty():
     user = UserFactory()
@@ -3,12 +3,25 @@ from django.core.exceptions import ValidationError
 
 from jobserver.backends import backends_to_choices
 from jobserver.forms import JobRequestCreateForm, WorkspaceCreateForm
-from jobserver.models import Backend
+
+
+def test_jobrequestcreateform_with_actions():
+    form = JobRequestCreateForm(["test1", "test2"])
+
+    assert form.fields["requested_actions"].choices == [
+        ("test1", "test1"),
+        ("test2", "test2"),
+    ]
+
+    # the requested_actions field is copied for each form instance
+    other_form = JobRequestCreateForm(["test3"])
+    assert len(form.fields["requested_actions"].choices) == 2
+    assert other_form.fields["requested_actions"].choices == [("test3", "test3")]
 
 
 @pytest.mark.django_db
-def test_jobrequestcreateform_with_backends():
-    choices = backends_to_choices(Backend.objects.all())
+def test_jobrequestcreateform_with_backends(backends):
+    choices = backends_to_choices(backends.values())
     form = JobRequestCreateForm([], backends=choices)
 
     assert "backend" in form.fields
@@ -22,6 +35,14 @@ def test_jobrequestcreateform_without_backends():
     assert "backend" not in form.fields
 
 
+def test_workspacecreateform_shares_helper():
+    form1 = WorkspaceCreateForm([])
+    form2 = WorkspaceCreateForm([])
+
+    assert form1.helper is form2.helper
+    assert [i.name for i in form1.helper.inputs] == ["submit"]
+
+
 @pytest.mark.django_db
 def test_workspacecreateform_success():
     data = {
@@ -63,6 +84,25 @@ def test_workspacecreateform_success_with_upper_case_names():
     assert form.cleaned_data["name"] == "test"
 
 
+def test_workspacecreateform_clean_branch_is_case_insensitive():
+    repos_with_branches = [
+        {
+            "name": "test-repo",
+            "url": "http://example.com/derp/test-repo",
+            "branches": ["Test-Branch"],
+        }
+    ]
+    form = WorkspaceCreateForm(repos_with_branches)
+    form.cleaned_data = {
+        "name": "test",
+        "db": "slice",
+        "repo": "http://example.com/derp/test-repo",
+        "branch": "test-BRANCH",
+    }
+
+    assert form.clean_branch() == "test-BRANCH"
+
+
 def test_workspacecreateform_unknown_branch():
     repos_with_branches = [
         {
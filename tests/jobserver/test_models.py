@@ -40,7 +40,7 @@ from ..factories import (
 def test_backend_no_configured_backends(monkeypatch):
     monkeypatch.setenv("BACKENDS", "")
 
-    # backends are created by migrations
+    # backends are seeded into the test database
     assert Backend.objects.count() == 3
 
 
@@ -48,7 +48,7 @@ def test_backend_no_configured_backends(monkeypatch):
 def test_backend_one_configured_backend(monkeypatch):
     monkeypatch.setenv("BACKENDS", "tpp")
 
-    # backends are created by migrations
+    # backends are seeded into the test database
     assert Backend.objects.count() == 1
 
 
@@ -191,11 +191,27 @@ def test_jobrequest_completed_at_no_jobs():
 def test_jobrequest_completed_at_success():
     job_request = JobRequestFactory()
 
-    job1, job2 = JobFactory.create_batch(2, job_request=job_request, status="succeeded")
+    JobFactory(
+        job_request=job_request,
+        status="succeeded",
+        completed_at=timezone.now() - timedelta(minutes=1),
+    )
+    job2 = JobFactory(
+        job_request=job_request, status="succeeded", completed_at=timezone.now()
+    )
 
     assert job_request.completed_at == job2.completed_at
 
 
+@pytest.mark.django_db
+def test_jobrequest_completed_at_finished_without_completed_at():
+    job_request = JobRequestFactory()
+
+    JobFactory(job_request=job_request, status="failed", completed_at=None)
+
+    assert job_request.completed_at is None
+
+
 @pytest.mark.django_db
 def test_jobrequest_completed_at_while_incomplete():
     job_request = JobRequestFactory()
@@ -291,6 +307,27 @@ def test_job_request_num_completed_success():
     assert job_request.num_completed == 2
 
 
+@pytest.mark.django_db
+def test_jobrequest_properties_use_prefetched_jobs(django_assert_num_queries):
+    job_request = JobRequestFactory()
+    JobFactory(
+        job_request=job_request,
+        status="succeeded",
+        started_at=timezone.now() - timedelta(minutes=2),
+        completed_at=timezone.now(),
+    )
+
+    job_request = JobRequest.objects.prefetch_related("jobs").get(pk=job_request.pk)
+
+    with django_assert_num_queries(0):
+        assert job_request.completed_at
+        assert not job_request.is_invalid
+        assert job_request.num_completed == 1
+        assert job_request.runtime.minutes == 2
+        assert job_request.started_at
+        assert job_request.status == "succeeded"
+
+
 @pytest.mark.django_db
 def test_jobrequest_runtime_one_job_missing_completed_at(freezer):
     job_request = JobRequestFactory()
@@ -502,6 +539,28 @@ def test_jobrequestqueryset_unacked():
     assert JobRequest.objects.unacked().count() == 3
 
 
+@pytest.mark.django_db
+def test_jobrequestqueryset_with_job_summaries(django_assert_num_queries):
+    job_request = JobRequestFactory()
+    JobFactory(
+        job_request=job_request,
+        status="succeeded",
+        started_at=timezone.now() - timedelta(minutes=2),
+        completed_at=timezone.now(),
+    )
+
+    job_request = JobRequest.objects.with_job_summaries().get(pk=job_request.pk)
+
+    with django_assert_num_queries(0):
+        assert job_request.runtime.minutes == 2
+        assert job_request.status == "succeeded"
+
+        job = job_request.jobs.all()[0]
+        assert job.get_absolute_url()
+        assert job.runtime.minutes == 2
+        assert job.status_message == ""
+
+
 @pytest.mark.django_db
 def test_org_get_absolute_url():
     org = OrgFactory()
@@ -564,12 +623,16 @@ def test_project_str():
 
 
 @pytest.mark.django_db
-def test_projectinvitation_create_membership():
+def test_projectinvitation_create_membership(django_assert_num_queries):
     invite = ProjectInvitationFactory(accepted_at=None, membership=None)
+    invite = ProjectInvitation.objects.get(pk=invite.pk)
 
     assert not ProjectMembership.objects.exists()
 
-    invite.create_membership()
+    # create the membership and save the invite without fetching the
+    # Project or User
+    with django_assert_num_queries(4):
+        invite.create_membership()
 
     assert ProjectMembership.objects.exists()
 
@@ -680,8 +743,8 @@ def test_researcher_registration_str():
 
 
 @pytest.mark.django_db
-def test_stats_str_with_last_seen(freezer):
-    tpp = Backend.objects.get(name="tpp")
+def test_stats_str_with_last_seen(freezer, backends):
+    tpp = backends["tpp"]
 
     last_seen = datetime(2020, 12, 25, 10, 11, 12, tzinfo=timezone.utc)
     stats = StatsFactory(backend=tpp, api_last_seen=last_seen, url="/foo")
@@ -690,8 +753,8 @@ def test_stats_str_with_last_seen(freezer):
 
 
 @pytest.mark.django_db
-def test_stats_str_without_last_seen(freezer):
-    tpp = Backend.objects.get(name="tpp")
+def test_stats_str_without_last_seen(freezer, backends):
+    tpp = backends["tpp"]
 
     stats = StatsFactory(backend=tpp, api_last_seen=None, url="")
 
@@ -830,7 +893,7 @@ def test_workspace_get_action_status_lut_no_jobs():
 
 
 @pytest.mark.django_db
-def test_workspace_get_action_status_lut_success():
+def test_workspace_get_action_status_lut_success(django_assert_num_queries):
     workspace1 = WorkspaceFactory()
     job_request = JobRequestFactory(workspace=workspace1)
     JobFactory(job_request=job_request, action="action1", status="pending")
@@ -891,7 +954,8 @@ def test_workspace_get_action_status_lut_success():
         created_at=timezone.now() - timedelta(minutes=1),
     )
 
-    output = workspace2.get_action_status_lut()
+    with django_assert_num_queries(1):
+        output = workspace2.get_action_status_lut()
     expected = {
         "action1": "succeeded",
         "action2": "failed",
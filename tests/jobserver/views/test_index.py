@@ -1,7 +1,4 @@
-from unittest.mock import patch
-
 import pytest
-from django.contrib.auth.models import AnonymousUser
 
 from jobserver.views.index import Index
 
@@ -12,15 +9,14 @@ MEANINGLESS_URL = "/"
 
 
 @pytest.mark.django_db
-def test_index_success(rf):
+def test_index_success(rf, github_membership_ok):
     JobRequestFactory(workspace=WorkspaceFactory())
 
     # Build a RequestFactory instance
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
 
-    with patch("jobserver.views.index.can_run_jobs", return_value=True, autospec=True):
-        response = Index.as_view()(request)
+    response = Index.as_view()(request)
 
     assert response.status_code == 200
     assert len(response.context_data["job_requests"]) == 1
@@ -28,7 +24,7 @@ def test_index_success(rf):
 
 
 @pytest.mark.django_db
-def test_index_with_authenticated_user(rf):
+def test_index_with_authenticated_user(rf, github_membership_ok):
     """
     Check the Add Workspace button is rendered for authenticated Users on the
     homepage.
@@ -39,14 +35,15 @@ def test_index_with_authenticated_user(rf):
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
 
-    with patch("jobserver.views.index.can_run_jobs", return_value=True, autospec=True):
-        response = Index.as_view()(request)
+    response = Index.as_view()(request)
 
     assert "Add a New Workspace" in response.rendered_content
 
 
 @pytest.mark.django_db
-def test_index_with_authenticated_but_partially_registered_user(rf):
+def test_index_with_authenticated_but_partially_registered_user(
+    rf, github_membership_forbidden
+):
     """
     Check the Add Workspace button is rendered for authenticated Users on the
     homepage.
@@ -57,23 +54,19 @@ def test_index_with_authenticated_but_partially_registered_user(rf):
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
 
-    with patch("jobserver.views.index.can_run_jobs", return_value=False, autospec=True):
-        response = Index.as_view()(request)
+    response = Index.as_view()(request)
 
     assert "Add a New Workspace" not in response.rendered_content
 
 
 @pytest.mark.django_db
-def test_index_with_unauthenticated_user(rf):
+def test_index_with_unauthenticated_user(anon_get_request):
     """
     Check the Add Workspace button is not rendered for unauthenticated Users on
     the homepage.
     """
     JobRequestFactory(workspace=WorkspaceFactory())
 
-    # Build a RequestFactory instance
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-    response = Index.as_view()(request)
+    response = Index.as_view()(anon_get_request)
 
     assert "Add a New Workspace" not in response.rendered_content
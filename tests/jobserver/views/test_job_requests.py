@@ -1,11 +1,8 @@
 import pytest
-import responses
 from django.conf import settings
-from django.contrib.auth.models import AnonymousUser
 from django.http import Http404
 from django.urls import reverse
 
-from jobserver.models import Backend
 from jobserver.views.job_requests import (
     JobRequestCancel,
     JobRequestDetail,
@@ -19,6 +16,7 @@ from ...factories import (
     UserFactory,
     UserSocialAuthFactory,
     WorkspaceFactory,
+    bulk_create_jobs,
 )
 
 
@@ -26,20 +24,17 @@ MEANINGLESS_URL = "/"
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobrequestcancel_already_finished(rf):
+def test_jobrequestcancel_already_finished(rf, github_membership_ok):
     job_request = JobRequestFactory(cancelled_actions=[])
-    JobFactory(job_request=job_request, status="succeeded")
-    JobFactory(job_request=job_request, status="failed")
+    bulk_create_jobs(
+        [{"status": "succeeded"}, {"status": "failed"}], job_request=job_request
+    )
 
     user = UserFactory()
 
     request = rf.post(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     response = JobRequestCancel.as_view()(request, pk=job_request.pk)
 
     assert response.status_code == 302
@@ -50,21 +45,17 @@ def test_jobrequestcancel_already_finished(rf):
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobrequestcancel_success(rf):
+def test_jobrequestcancel_success(rf, github_membership_ok):
     job_request = JobRequestFactory(cancelled_actions=[])
-    JobFactory(job_request=job_request, action="test1")
-    JobFactory(job_request=job_request, action="test2")
-    JobFactory(job_request=job_request, action="test3")
+    bulk_create_jobs(
+        [{"action": f"test{i}"} for i in range(1, 4)], job_request=job_request
+    )
 
     user = UserFactory()
 
     request = rf.post(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     response = JobRequestCancel.as_view()(request, pk=job_request.pk)
 
     assert response.status_code == 302
@@ -76,51 +67,35 @@ def test_jobrequestcancel_success(rf):
     assert "test3" in job_request.cancelled_actions
 
 
-@pytest.mark.django_db
-@responses.activate
-def test_jobrequestcancel_unauthorized(rf):
-    job_request = JobRequestFactory()
-    user = UserFactory()
-
+def test_jobrequestcancel_unauthorized(rf, github_membership_forbidden):
     request = rf.post(MEANINGLESS_URL)
-    request.user = user
+    request.user = UserFactory.build()
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=404)
-
-    response = JobRequestCancel.as_view()(request, pk=job_request.pk)
+    response = JobRequestCancel.as_view()(request, pk=0)
 
     assert response.status_code == 302
     assert response.url == f"{settings.LOGIN_URL}?next=/"
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobrequestcancel_unknown_job_request(rf):
+def test_jobrequestcancel_unknown_job_request(rf, github_membership_ok):
     user = UserFactory()
 
     request = rf.post(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     with pytest.raises(Http404):
         JobRequestCancel.as_view()(request, pk=0)
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobrequestdetail_with_authenticated_user(rf):
+def test_jobrequestdetail_with_authenticated_user(rf, github_membership_ok):
     job_request = JobRequestFactory()
     user = UserFactory(is_superuser=False, roles=[])
 
     request = rf.get(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     response = JobRequestDetail.as_view()(request, pk=job_request.pk)
 
     assert response.status_code == 200
@@ -128,18 +103,12 @@ def test_jobrequestdetail_with_authenticated_user(rf):
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobrequestdetail_with_superuser(rf, superuser):
+def test_jobrequestdetail_with_superuser(rf, superuser, github_membership_ok):
     job_request = JobRequestFactory()
 
     request = rf.get(MEANINGLESS_URL)
     request.user = superuser
 
-    membership_url = (
-        f"https://api.github.com/orgs/opensafely/members/{superuser.username}"
-    )
-    responses.add(responses.GET, membership_url, status=204)
-
     response = JobRequestDetail.as_view()(request, pk=job_request.pk)
 
     assert response.status_code == 200
@@ -147,12 +116,10 @@ def test_jobrequestdetail_with_superuser(rf, superuser):
 
 
 @pytest.mark.django_db
-def test_jobrequestdetail_with_unauthenticated_user(rf):
+def test_jobrequestdetail_with_unauthenticated_user(anon_get_request):
     job_request = JobRequestFactory()
 
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-    response = JobRequestDetail.as_view()(request, pk=job_request.pk)
+    response = JobRequestDetail.as_view()(anon_get_request, pk=job_request.pk)
 
     assert response.status_code == 200
     assert "Zombify" not in response.rendered_content
@@ -170,14 +137,14 @@ def test_jobrequestlist_filters_exist(rf):
 
 
 @pytest.mark.django_db
-def test_jobrequestlist_filter_by_backend(rf):
-    emis = Backend.objects.get(name="emis")
+def test_jobrequestlist_filter_by_backend(rf, backends):
+    emis = backends["emis"]
     job_request = JobRequestFactory(backend=emis)
-    JobFactory.create_batch(2, job_request=job_request)
+    bulk_create_jobs(2, job_request=job_request)
 
-    tpp = Backend.objects.get(name="tpp")
+    tpp = backends["tpp"]
     job_request = JobRequestFactory(backend=tpp)
-    JobFactory.create_batch(2, job_request=job_request)
+    bulk_create_jobs(2, job_request=job_request)
 
     # Build a RequestFactory instance
     request = rf.get(f"/?backend={emis.pk}")
@@ -208,22 +175,26 @@ def test_jobrequestlist_filter_by_status_and_workspace(rf):
 
     # running
     job_request1 = JobRequestFactory(workspace=workspace1)
-    JobFactory(job_request=job_request1, status="running")
-    JobFactory(job_request=job_request1, status="pending")
+    bulk_create_jobs(
+        [{"status": "running"}, {"status": "pending"}], job_request=job_request1
+    )
 
     # failed
     job_request2 = JobRequestFactory(workspace=workspace1)
-    JobFactory(job_request=job_request2, status="succeeded")
-    JobFactory(job_request=job_request2, status="failed")
+    bulk_create_jobs(
+        [{"status": "succeeded"}, {"status": "failed"}], job_request=job_request2
+    )
 
     # running
     job_request3 = JobRequestFactory(workspace=workspace2)
-    JobFactory.create_batch(2, job_request=job_request3, status="succeeded")
-    JobFactory.create_batch(2, job_request=job_request3, status="pending")
+    bulk_create_jobs(
+        [{"status": "succeeded"}] * 2 + [{"status": "pending"}] * 2,
+        job_request=job_request3,
+    )
 
     # succeeded
     job_request4 = JobRequestFactory(workspace=workspace2)
-    JobFactory.create_batch(3, job_request=job_request4, status="succeeded")
+    bulk_create_jobs(3, job_request=job_request4, status="succeeded")
 
     # Build a RequestFactory instance
     request = rf.get(f"/?status=running&workspace={workspace2.pk}")
@@ -300,36 +271,41 @@ def test_jobrequestlist_find_job_request_by_identifier_unknown_job_request(rf):
 
 
 @pytest.mark.django_db
-def test_jobrequestlist_search_by_action(rf):
-    job_request1 = JobRequestFactory()
-    JobFactory(job_request=job_request1, action="run")
-
-    job_request2 = JobRequestFactory()
-    JobFactory(job_request=job_request2, action="leap")
+def test_jobrequestlist_num_queries(rf, django_assert_num_queries):
+    for workspace in WorkspaceFactory.create_batch(3):
+        job_request = JobRequestFactory(workspace=workspace)
+        bulk_create_jobs(2, job_request=job_request)
 
-    # Build a RequestFactory instance
-    request = rf.get("/?q=run")
+    request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
-    response = JobRequestList.as_view()(request)
 
-    assert len(response.context_data["object_list"]) == 1
-    assert response.context_data["object_list"][0] == job_request1
+    # the number of queries shouldn't grow with the JobRequests (or their
+    # Backends and Workspaces) being listed
+    with django_assert_num_queries(7):
+        response = JobRequestList.as_view()(request)
+        response.render()
+
+    assert len(response.context_data["object_list"]) == 3
 
 
 @pytest.mark.django_db
-def test_jobrequestlist_search_by_id(rf):
-    JobFactory(job_request=JobRequestFactory())
+@pytest.mark.parametrize("q,expected", [("run", "run"), ("99", "leap")])
+def test_jobrequestlist_search(rf, q, expected):
+    run = JobRequestFactory()
+    JobFactory(job_request=run, action="run")
 
-    job_request2 = JobRequestFactory()
-    JobFactory(job_request=job_request2, id=99)
+    leap = JobRequestFactory()
+    JobFactory(job_request=leap, action="leap", id=99)
+
+    job_requests = {"run": run, "leap": leap}
 
     # Build a RequestFactory instance
-    request = rf.get("/?q=99")
+    request = rf.get(f"/?q={q}")
     request.user = UserFactory()
     response = JobRequestList.as_view()(request)
 
     assert len(response.context_data["object_list"]) == 1
-    assert response.context_data["object_list"][0] == job_request2
+    assert response.context_data["object_list"][0] == job_requests[expected]
 
 
 @pytest.mark.django_db
@@ -337,8 +313,7 @@ def test_jobrequestlist_success(rf):
     user = UserSocialAuthFactory().user
 
     job_request = JobRequestFactory(created_by=user)
-    JobFactory(job_request=job_request)
-    JobFactory(job_request=job_request)
+    bulk_create_jobs(2, job_request=job_request)
 
     # Build a RequestFactory instance
     request = rf.get(MEANINGLESS_URL)
@@ -355,8 +330,7 @@ def test_jobrequestlist_success(rf):
 @pytest.mark.django_db
 def test_jobrequestlist_with_authenticated_user(rf):
     job_request = JobRequestFactory()
-    JobFactory(job_request=job_request)
-    JobFactory(job_request=job_request)
+    bulk_create_jobs(2, job_request=job_request)
 
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory(is_superuser=False, roles=[])
@@ -369,8 +343,7 @@ def test_jobrequestlist_with_authenticated_user(rf):
 @pytest.mark.django_db
 def test_jobrequestlist_with_superuser(rf, superuser):
     job_request = JobRequestFactory()
-    JobFactory(job_request=job_request)
-    JobFactory(job_request=job_request)
+    bulk_create_jobs(2, job_request=job_request)
 
     request = rf.get(MEANINGLESS_URL)
     request.user = superuser
@@ -381,49 +354,35 @@ def test_jobrequestlist_with_superuser(rf, superuser):
 
 
 @pytest.mark.django_db
-def test_jobrequestlist_with_unauthenticated_user(rf):
+def test_jobrequestlist_with_unauthenticated_user(anon_get_request):
     job_request = JobRequestFactory()
-    JobFactory(job_request=job_request)
-    JobFactory(job_request=job_request)
+    bulk_create_jobs(2, job_request=job_request)
 
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-    response = JobRequestList.as_view()(request)
+    response = JobRequestList.as_view()(anon_get_request)
 
     assert response.status_code == 200
     assert "Look up JobRequest by Identifier" not in response.rendered_content
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobrequestzombify_not_superuser(client):
+def test_jobrequestzombify_not_superuser(messaged_request):
     job_request = JobRequestFactory()
-    JobFactory.create_batch(
-        5,
-        job_request=job_request,
-        completed_at=None,
-    )
-    user = UserFactory(roles=[])
-
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
+    bulk_create_jobs(5, job_request=job_request, completed_at=None)
 
-    client.force_login(user)
-    response = client.post(f"/job-requests/{job_request.pk}/zombify/", follow=True)
+    request = messaged_request("post", MEANINGLESS_URL, user=UserFactory(roles=[]))
 
-    assert response.status_code == 200
+    response = JobRequestZombify.as_view()(request, pk=job_request.pk)
 
-    # did we redirect to the correct JobDetail page?
-    assert response.redirect_chain == [(job_request.get_absolute_url(), 302)]
+    # did we redirect to the correct JobRequestDetail page?
+    assert response.status_code == 302
+    assert response.url == job_request.get_absolute_url()
 
-    # has the Job been left untouched?
-    job_request.refresh_from_db()
-    for job in job_request.jobs.all():
-        assert job.status == ""
-        assert job.status_message == ""
+    # have the Jobs been left untouched?
+    statuses = job_request.jobs.values_list("status", "status_message")
+    assert list(statuses) == [("", "")] * 5
 
     # did we produce a message?
-    messages = list(response.context["messages"])
+    messages = list(request._messages)
     assert len(messages) == 1
     assert str(messages[0]) == "Only admins can zombify Jobs."
 
@@ -442,10 +401,8 @@ def test_jobrequestzombify_success(rf, superuser):
     assert response.status_code == 302
     assert response.url == job_request.get_absolute_url()
 
-    jobs = job_request.jobs.all()
-
-    assert all(j.status == "failed" for j in jobs)
-    assert all(j.status_message == "Job manually zombified" for j in jobs)
+    statuses = job_request.jobs.values_list("status", "status_message")
+    assert list(statuses) == [("failed", "Job manually zombified")] * 2
 
 
 @pytest.mark.django_db
@@ -1,9 +1,5 @@
-from unittest.mock import patch
-
 import pytest
-import responses
 from django.conf import settings
-from django.contrib.auth.models import AnonymousUser
 from django.http import Http404
 from django.urls import reverse
 
@@ -16,64 +12,24 @@ MEANINGLESS_URL = "/"
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobcancel_already_cancelled(rf):
-    job_request = JobRequestFactory(cancelled_actions=["another-action", "test"])
-    job = JobFactory(job_request=job_request, action="test")
-
-    user = UserFactory()
-
-    request = rf.post(MEANINGLESS_URL)
-    request.user = user
-
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
-    response = JobCancel.as_view()(request, identifier=job.identifier)
-
-    assert response.status_code == 302
-    assert response.url == reverse("job-detail", kwargs={"identifier": job.identifier})
-
-    job_request.refresh_from_db()
-    assert job_request.cancelled_actions == ["another-action", "test"]
-
-
-@pytest.mark.django_db
-@responses.activate
-def test_jobcancel_already_finished(rf):
-    job_request = JobRequestFactory(cancelled_actions=["another-action"])
-    job = JobFactory(job_request=job_request, action="test", status="finished")
-
-    user = UserFactory()
+@pytest.mark.parametrize(
+    "cancelled_actions,status,expected",
+    [
+        # already cancelled
+        (["another-action", "test"], "", ["another-action", "test"]),
+        # already finished
+        (["another-action"], "finished", ["another-action", "test"]),
+        # success
+        ([], "", ["test"]),
+    ],
+    ids=["already_cancelled", "already_finished", "success"],
+)
+def test_jobcancel(rf, github_membership_ok, cancelled_actions, status, expected):
+    job_request = JobRequestFactory(cancelled_actions=cancelled_actions)
+    job = JobFactory(job_request=job_request, action="test", status=status)
 
     request = rf.post(MEANINGLESS_URL)
-    request.user = user
-
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
-    response = JobCancel.as_view()(request, identifier=job.identifier)
-
-    assert response.status_code == 302
-    assert response.url == reverse("job-detail", kwargs={"identifier": job.identifier})
-
-    job_request.refresh_from_db()
-    assert job_request.cancelled_actions == ["another-action", "test"]
-
-
-@pytest.mark.django_db
-@responses.activate
-def test_jobcancel_success(rf):
-    job_request = JobRequestFactory(cancelled_actions=[])
-    job = JobFactory(job_request=job_request, action="test")
-
-    user = UserFactory()
-
-    request = rf.post(MEANINGLESS_URL)
-    request.user = user
-
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
+    request.user = UserFactory()
 
     response = JobCancel.as_view()(request, identifier=job.identifier)
 
@@ -81,106 +37,86 @@ def test_jobcancel_success(rf):
     assert response.url == reverse("job-detail", kwargs={"identifier": job.identifier})
 
     job_request.refresh_from_db()
-    assert job_request.cancelled_actions == ["test"]
+    assert job_request.cancelled_actions == expected
 
 
-@pytest.mark.django_db
-@responses.activate
-def test_jobcancel_unauthorized(rf):
-    job = JobFactory(job_request=JobRequestFactory())
-    user = UserFactory()
-
+def test_jobcancel_unauthorized(rf, github_membership_forbidden):
     request = rf.post(MEANINGLESS_URL)
-    request.user = user
+    request.user = UserFactory.build()
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=404)
-
-    response = JobCancel.as_view()(request, identifier=job.identifier)
+    response = JobCancel.as_view()(request, identifier="0000000000000000")
 
     assert response.status_code == 302
     assert response.url == f"{settings.LOGIN_URL}?next=/"
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_jobcancel_unknown_job(rf):
+def test_jobcancel_unknown_job(rf, github_membership_ok):
     user = UserFactory()
 
     request = rf.post(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     with pytest.raises(Http404):
         JobCancel.as_view()(request, identifier="not-real")
 
 
 @pytest.mark.django_db
-def test_jobdetail_with_authenticated_user(rf):
+def test_jobdetail_with_authenticated_user(rf, github_membership_ok):
     job = JobFactory()
 
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory(is_superuser=False, roles=[])
 
-    with patch("jobserver.views.jobs.can_run_jobs", return_value=True):
-        response = JobDetail.as_view()(request, identifier=job.identifier)
+    response = JobDetail.as_view()(request, identifier=job.identifier)
 
     assert response.status_code == 200
     assert "Zombify" not in response.rendered_content
 
 
 @pytest.mark.django_db
-def test_jobdetail_with_post_jobrequest_job(rf):
+def test_jobdetail_with_post_jobrequest_job(rf, github_membership_forbidden):
     job = JobFactory()
 
     # Build a RequestFactory instance
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
-    with patch("jobserver.views.jobs.can_run_jobs", return_value=False):
-        response = JobDetail.as_view()(request, identifier=job.identifier)
+    response = JobDetail.as_view()(request, identifier=job.identifier)
 
     assert response.status_code == 200
 
 
 @pytest.mark.django_db
-def test_jobdetail_with_pre_jobrequest_job(rf):
+def test_jobdetail_with_pre_jobrequest_job(rf, github_membership_forbidden):
     job_request = JobRequestFactory(workspace=WorkspaceFactory())
     job = JobFactory(job_request=job_request)
 
     # Build a RequestFactory instance
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
-    with patch("jobserver.views.jobs.can_run_jobs", return_value=False):
-        response = JobDetail.as_view()(request, identifier=job.identifier)
+    response = JobDetail.as_view()(request, identifier=job.identifier)
 
     assert response.status_code == 200
 
 
 @pytest.mark.django_db
-def test_jobdetail_with_superuser(rf, superuser):
+def test_jobdetail_with_superuser(rf, superuser, github_membership_ok):
     job = JobFactory()
 
     request = rf.get(MEANINGLESS_URL)
     request.user = superuser
 
-    with patch("jobserver.views.jobs.can_run_jobs", return_value=True):
-        response = JobDetail.as_view()(request, identifier=job.identifier)
+    response = JobDetail.as_view()(request, identifier=job.identifier)
 
     assert response.status_code == 200
     assert "Zombify" in response.rendered_content
 
 
 @pytest.mark.django_db
-def test_jobdetail_with_unauthenticated_user(rf):
+def test_jobdetail_with_unauthenticated_user(anon_get_request):
     job = JobFactory()
 
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-
-    with patch("jobserver.views.jobs.can_run_jobs", return_value=False):
-        response = JobDetail.as_view()(request, identifier=job.identifier)
+    response = JobDetail.as_view()(anon_get_request, identifier=job.identifier)
 
     assert response.status_code == 200
     assert "Zombify" not in response.rendered_content
@@ -195,18 +131,16 @@ def test_jobdetail_with_unknown_job(rf):
 
 
 @pytest.mark.django_db
-def test_jobzombify_not_superuser(client):
+def test_jobzombify_not_superuser(messaged_request):
     job = JobFactory(completed_at=None)
 
-    client.force_login(UserFactory(roles=[]))
-    with patch("jobserver.views.jobs.can_run_jobs", return_value=False):
-        response = client.post(f"/jobs/{job.identifier}/zombify/", follow=True)
+    request = messaged_request("post", MEANINGLESS_URL, user=UserFactory(roles=[]))
 
-    assert response.status_code == 200
+    response = JobZombify.as_view()(request, identifier=job.identifier)
 
     # did we redirect to the correct JobDetail page?
-    url = reverse("job-detail", kwargs={"identifier": job.identifier})
-    assert response.redirect_chain == [(url, 302)]
+    assert response.status_code == 302
+    assert response.url == reverse("job-detail", kwargs={"identifier": job.identifier})
 
     # has the Job been left untouched?
     job.refresh_from_db()
@@ -214,7 +148,7 @@ def test_jobzombify_not_superuser(client):
     assert job.status_message == ""
 
     # did we produce a message?
-    messages = list(response.context["messages"])
+    messages = list(request._messages)
     assert len(messages) == 1
     assert str(messages[0]) == "Only admins can zombify Jobs."
 
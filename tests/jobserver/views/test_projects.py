@@ -1,5 +1,4 @@
 import pytest
-from django.contrib.messages.storage.fallback import FallbackStorage
 from django.http import Http404
 
 from jobserver.authorization import ProjectCoordinator
@@ -72,19 +71,13 @@ def test_projectacceptinvite_unknown_invite(rf):
 
 
 @pytest.mark.django_db
-def test_projectacceptinvite_with_different_user(rf):
+def test_projectacceptinvite_with_different_user(messaged_request):
     org = OrgFactory()
     project = ProjectFactory(org=org)
     invitee = UserFactory()
     invite = ProjectInvitationFactory(project=project, user=invitee)
 
-    request = rf.get(MEANINGLESS_URL)
-    request.user = UserFactory()
-
-    # set up messages framework
-    request.session = "session"
-    messages = FallbackStorage(request)
-    request._messages = messages
+    request = messaged_request("get", MEANINGLESS_URL, user=UserFactory())
 
     response = ProjectAcceptInvite.as_view()(
         request,
@@ -97,7 +90,7 @@ def test_projectacceptinvite_with_different_user(rf):
     assert response.url == "/"
 
     # check we have a message for the user
-    messages = list(messages)
+    messages = list(request._messages)
     assert len(messages) == 1
     assert str(messages[0]) == "Only the User who was invited may accept an invite."
 
@@ -195,7 +188,7 @@ def test_projectcreate_post_invalid_data(rf, superuser):
     response = ProjectCreate.as_view()(request, org_slug=org.slug)
 
     assert response.status_code == 200
-    assert Project.objects.count() == 0
+    assert not Project.objects.exists()
 
 
 @pytest.mark.django_db
@@ -385,20 +378,16 @@ def test_projectremovemember_unknown_project_membership(rf, superuser):
 
 
 @pytest.mark.django_db
-def test_projectremovemember_without_permission(rf, superuser):
+def test_projectremovemember_without_permission(superuser, messaged_request):
     org = OrgFactory()
     project = ProjectFactory(org=org)
     member = UserFactory()
 
     membership = ProjectMembershipFactory(project=project, user=member)
 
-    request = rf.post("/", {"username": member.username})
-    request.user = superuser
-
-    # set up messages framework
-    request.session = "session"
-    messages = FallbackStorage(request)
-    request._messages = messages
+    request = messaged_request(
+        "post", "/", {"username": member.username}, user=superuser
+    )
 
     response = ProjectRemoveMember.as_view()(
         request, org_slug=org.slug, project_slug=project.slug
@@ -411,7 +400,7 @@ def test_projectremovemember_without_permission(rf, superuser):
     assert ProjectMembership.objects.filter(pk=membership.pk).exists()
 
     # check we have a message for the user
-    messages = list(messages)
+    messages = list(request._messages)
     assert len(messages) == 1
     assert str(messages[0]) == "You do not have permission to remove Project members."
 
@@ -467,7 +456,7 @@ def test_projectsettings_post_success(rf, superuser):
 
 
 @pytest.mark.django_db
-def test_projectsettings_post_with_email_failure(rf, superuser, mocker):
+def test_projectsettings_post_with_email_failure(superuser, mocker, messaged_request):
     org = OrgFactory()
     project = ProjectFactory(org=org)
     invitee = UserFactory()
@@ -476,13 +465,9 @@ def test_projectsettings_post_with_email_failure(rf, superuser, mocker):
         project=project, user=superuser, roles=[ProjectCoordinator]
     )
 
-    request = rf.post(MEANINGLESS_URL, {"users": [str(invitee.pk)]})
-    request.user = superuser
-
-    # set up messages framework
-    request.session = "session"
-    messages = FallbackStorage(request)
-    request._messages = messages
+    request = messaged_request(
+        "post", MEANINGLESS_URL, {"users": [str(invitee.pk)]}, user=superuser
+    )
 
     # mock send_project_invite_email to throw an exception
     mocker.patch(
@@ -501,7 +486,7 @@ def test_projectsettings_post_with_email_failure(rf, superuser, mocker):
     assert not ProjectInvitation.objects.exists()
 
     # check we have a message for the user
-    messages = list(messages)
+    messages = list(request._messages)
     assert len(messages) == 1
     expected = f"<p>Failed to invite 1 User(s):</p><ul><li>{invitee.username}</li></ul><p>Please try again.</p>"
     assert str(messages[0]) == expected
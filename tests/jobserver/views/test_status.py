@@ -4,57 +4,62 @@ import pytest
 from django.utils import timezone
 from first import first
 
-from jobserver.models import Backend
 from jobserver.views.status import Status
 
-from ...factories import JobFactory, JobRequestFactory, StatsFactory
+from ...factories import (
+    JobRequestFactory,
+    StatsFactory,
+    UserFactory,
+    WorkspaceFactory,
+    bulk_create_jobs,
+)
 
 
 MEANINGLESS_URL = "/"
 
 
 @pytest.mark.django_db
-def test_status_healthy(rf):
-    tpp = Backend.objects.get(name="tpp")
-
-    # acked, because JobFactory will implicitly create JobRequests
-    JobFactory.create_batch(3, job_request__backend=tpp)
-
-    last_seen = timezone.now() - timedelta(minutes=1)
-    StatsFactory(backend=tpp, api_last_seen=last_seen)
-
-    request = rf.get(MEANINGLESS_URL)
-    response = Status.as_view()(request)
-
-    tpp_output = first(
-        response.context_data["backends"], key=lambda b: b["name"] == "TPP"
+@pytest.mark.parametrize(
+    "acked,unacked,minutes_since_seen,show_warning",
+    [
+        pytest.param(3, 0, 1, False, id="healthy"),
+        pytest.param(0, 0, None, False, id="no_last_seen"),
+        pytest.param(0, 1, 1, False, id="unacked_jobs_but_recent_api_contact"),
+        pytest.param(2, 1, 10, True, id="unhealthy"),
+    ],
+)
+def test_status(
+    rf,
+    backends,
+    acked,
+    unacked,
+    minutes_since_seen,
+    show_warning,
+):
+    user = UserFactory()
+    workspace = WorkspaceFactory()
+
+    tpp = backends["tpp"]
+
+    # acked, because each JobRequest has a Job.  The Workspace and creator
+    # don't matter here so share them.
+    job_requests = JobRequestFactory.create_batch(
+        acked, backend=tpp, created_by=user, workspace=workspace
     )
+    for job_request in job_requests:
+        bulk_create_jobs(1, job_request=job_request)
 
-    assert tpp_output["last_seen"] == last_seen.strftime("%Y-%m-%d %H:%M:%S")
-    assert tpp_output["queue"]["acked"] == 3
-    assert tpp_output["queue"]["unacked"] == 0
-    assert not tpp_output["show_warning"]
-
-
-@pytest.mark.django_db
-def test_status_no_last_seen(rf):
-    request = rf.get(MEANINGLESS_URL)
-    response = Status.as_view()(request)
-
-    tpp_output = first(
-        response.context_data["backends"], key=lambda b: b["name"] == "TPP"
+    # unacked, because they have no Jobs
+    JobRequestFactory.create_batch(
+        unacked, backend=tpp, created_by=user, workspace=workspace
     )
 
-    assert tpp_output["last_seen"] == "never"
-    assert not tpp_output["show_warning"]
-
-
-@pytest.mark.django_db
-def test_status_unacked_jobs_but_recent_api_contact(rf):
-    tpp = Backend.objects.get(name="tpp")
-
-    last_seen = timezone.now() - timedelta(minutes=1)
-    StatsFactory(backend=tpp, api_last_seen=last_seen)
+    if minutes_since_seen is None:
+        expected_last_seen = "never"
+    else:
+        last_seen = timezone.now() - timedelta(minutes=minutes_since_seen)
+        StatsFactory(backend=tpp, api_last_seen=last_seen)
+        expected_last_seen = last_seen.strftime("%Y-%m-%d %H:%M:%S")
 
     request = rf.get(MEANINGLESS_URL)
     response = Status.as_view()(request)
@@ -63,26 +68,33 @@ def test_status_unacked_jobs_but_recent_api_contact(rf):
         response.context_data["backends"], key=lambda b: b["name"] == "TPP"
     )
 
-    assert tpp_output["last_seen"] == last_seen.strftime("%Y-%m-%d %H:%M:%S")
-    assert not tpp_output["show_warning"]
+    assert tpp_output["last_seen"] == expected_last_seen
+    assert tpp_output["queue"]["acked"] == acked
+    assert tpp_output["queue"]["unacked"] == unacked
+    assert tpp_output["show_warning"] == show_warning
 
 
 @pytest.mark.django_db
-def test_status_unhealthy(rf):
-    # backends are created by migrations so we can depend on them
-    tpp = Backend.objects.get(name="tpp")
+def test_status_counts_with_multiple_stats(rf, django_assert_num_queries, backends):
+    tpp = backends["tpp"]
 
-    # acked, because JobFactory will implicitly create JobRequests
-    JobFactory.create_batch(2, job_request__backend=tpp)
+    # acked, with multiple Jobs each
+    job_request1 = JobRequestFactory(backend=tpp)
+    bulk_create_jobs(2, job_request=job_request1)
+    job_request2 = JobRequestFactory(backend=tpp)
+    bulk_create_jobs(3, job_request=job_request2)
 
-    # unacked, because it has no Jobs
+    # unacked
     JobRequestFactory(backend=tpp)
 
-    last_seen = timezone.now() - timedelta(minutes=10)
+    last_seen = timezone.now() - timedelta(minutes=1)
     StatsFactory(backend=tpp, api_last_seen=last_seen, url="foo")
+    StatsFactory(backend=tpp, api_last_seen=last_seen - timedelta(hours=1))
 
     request = rf.get(MEANINGLESS_URL)
-    response = Status.as_view()(request)
+
+    with django_assert_num_queries(1):
+        response = Status.as_view()(request)
 
     tpp_output = first(
         response.context_data["backends"], key=lambda b: b["name"] == "TPP"
@@ -91,4 +103,3 @@ def test_status_unhealthy(rf):
     assert tpp_output["last_seen"] == last_seen.strftime("%Y-%m-%d %H:%M:%S")
     assert tpp_output["queue"]["acked"] == 2
     assert tpp_output["queue"]["unacked"] == 1
-    assert tpp_output["show_warning"]
@@ -1,5 +1,4 @@
 import pytest
-from django.contrib.messages.storage.fallback import FallbackStorage
 
 from jobserver.views.users import Settings
 
@@ -25,18 +24,12 @@ def test_settings_get(rf):
 
 
 @pytest.mark.django_db
-def test_settings_post(rf):
+def test_settings_post(messaged_request):
     UserFactory()
     user2 = UserFactory(notifications_email="original@example.com")
 
     data = {"notifications_email": "changed@example.com"}
-    request = rf.post(MEANINGLESS_URL, data)
-    request.user = user2
-
-    # set up messages framework
-    request.session = "session"
-    messages = FallbackStorage(request)
-    request._messages = messages
+    request = messaged_request("post", MEANINGLESS_URL, data, user=user2)
 
     response = Settings.as_view()(request)
     assert response.status_code == 302
@@ -46,6 +39,6 @@ def test_settings_post(rf):
 
     assert user2.notifications_email == "changed@example.com"
 
-    messages = list(messages)
+    messages = list(request._messages)
     assert len(messages) == 1
     assert str(messages[0]) == "Settings saved successfully"
@@ -1,10 +1,7 @@
 from unittest.mock import patch
 
 import pytest
-import responses
 from django.conf import settings
-from django.contrib.auth.models import AnonymousUser
-from django.contrib.messages.storage.fallback import FallbackStorage
 from django.http import Http404
 from django.urls import reverse
 
@@ -29,12 +26,29 @@ from ...factories import (
     ProjectMembershipFactory,
     UserFactory,
     WorkspaceFactory,
+    bulk_create_jobs,
 )
 
 
 MEANINGLESS_URL = "/"
 
 
+@pytest.fixture
+def dummy_project(monkeypatch):
+    dummy_yaml = """
+    actions:
+      twiddle:
+    """
+    monkeypatch.setattr(
+        "jobserver.views.workspaces.get_project", lambda *args: dummy_yaml
+    )
+
+    # the SHA JobRequests are created with when the form is POSTed
+    monkeypatch.setattr(
+        "jobserver.views.workspaces.get_branch_sha", lambda repo, branch: "abc123"
+    )
+
+
 @pytest.mark.django_db
 def test_baseworkspacedetail_requires_can_run_jobs(rf):
     request = rf.get(MEANINGLESS_URL)
@@ -92,17 +106,13 @@ def test_projectworkspacedetail_unknown_workspace(rf):
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_workspacearchivetoggle_success(rf):
+def test_workspacearchivetoggle_success(rf, github_membership_ok):
     workspace = WorkspaceFactory(is_archived=False)
     user = UserFactory()
 
     request = rf.post(MEANINGLESS_URL, {"is_archived": "True"})
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     response = WorkspaceArchiveToggle.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302
@@ -112,47 +122,40 @@ def test_workspacearchivetoggle_success(rf):
     assert workspace.is_archived
 
 
-@pytest.mark.django_db
-@responses.activate
-def test_workspacearchivetoggle_unauthorized(rf):
-    workspace = WorkspaceFactory()
-    user = UserFactory()
-
+def test_workspacearchivetoggle_unauthorized(rf, github_membership_forbidden):
     request = rf.post(MEANINGLESS_URL)
-    request.user = user
-
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=404)
+    request.user = UserFactory.build()
 
-    response = WorkspaceArchiveToggle.as_view()(request, name=workspace.name)
+    response = WorkspaceArchiveToggle.as_view()(request, name="test")
 
     assert response.status_code == 302
     assert response.url == f"{settings.LOGIN_URL}?next=/"
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_workspacecreate_get_success(rf):
+def test_workspacecreate_get_success(rf, monkeypatch, github_membership_ok):
+    monkeypatch.setattr(
+        "jobserver.views.workspaces.get_repos_with_branches", lambda *args: []
+    )
+
     user = UserFactory()
 
     request = rf.get(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
-    with patch(
-        "jobserver.views.workspaces.get_repos_with_branches", new=lambda *args: []
-    ):
-        response = WorkspaceCreate.as_view()(request)
+    response = WorkspaceCreate.as_view()(request)
 
     assert response.status_code == 200
     assert response.context_data["repos_with_branches"] == []
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_workspacecreate_post_success(rf):
+def test_workspacecreate_post_success(rf, monkeypatch, github_membership_ok):
+    repos = [{"name": "Test", "url": "test", "branches": ["test"]}]
+    monkeypatch.setattr(
+        "jobserver.views.workspaces.get_repos_with_branches", lambda *args: repos
+    )
+
     user = UserFactory()
 
     data = {
@@ -166,32 +169,18 @@ def test_workspacecreate_post_success(rf):
     request = rf.post(MEANINGLESS_URL, data)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
-    repos = [{"name": "Test", "url": "test", "branches": ["test"]}]
-    with patch(
-        "jobserver.views.workspaces.get_repos_with_branches", new=lambda *args: repos
-    ):
-        response = WorkspaceCreate.as_view()(request)
+    response = WorkspaceCreate.as_view()(request)
 
     assert response.status_code == 302
 
-    workspace = Workspace.objects.first()
+    workspace = Workspace.objects.get(name="test")
     assert response.url == reverse("workspace-detail", kwargs={"name": workspace.name})
     assert workspace.created_by == user
 
 
-@pytest.mark.django_db
-@responses.activate
-def test_workspacecreate_unauthorized(rf):
-    user = UserFactory()
-
+def test_workspacecreate_unauthorized(rf, github_membership_forbidden):
     request = rf.post(MEANINGLESS_URL)
-    request.user = user
-
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=404)
+    request.user = UserFactory.build()
 
     response = WorkspaceCreate.as_view()(request)
 
@@ -200,17 +189,15 @@ def test_workspacecreate_unauthorized(rf):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_logged_out(rf):
+def test_workspacedetail_logged_out(anon_get_request):
     workspace = WorkspaceFactory()
 
-    # Build a RequestFactory instance
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-
     with patch(
         "jobserver.views.workspaces.get_actions", autospec=True
     ) as mocked_get_actions:
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+        response = GlobalWorkspaceDetail.as_view()(
+            anon_get_request, name=workspace.name
+        )
 
     mocked_get_actions.assert_not_called()
 
@@ -221,7 +208,7 @@ def test_workspacedetail_logged_out(rf):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_project_yaml_errors(rf):
+def test_workspacedetail_project_yaml_errors(rf, github_membership_ok):
     workspace = WorkspaceFactory()
     user = UserFactory()
 
@@ -230,8 +217,6 @@ def test_workspacedetail_project_yaml_errors(rf):
     request.user = user
 
     with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch(
         "jobserver.views.workspaces.get_project",
         side_effect=Exception("test error"),
         autospec=True,
@@ -245,7 +230,9 @@ def test_workspacedetail_project_yaml_errors(rf):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_get_success(rf):
+def test_workspacedetail_get_success(
+    rf, github_membership_ok, dummy_project, django_assert_num_queries
+):
     workspace = WorkspaceFactory()
     user = UserFactory()
 
@@ -253,13 +240,7 @@ def test_workspacedetail_get_success(rf):
     request = rf.get(MEANINGLESS_URL)
     request.user = user
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch("jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml):
+    with django_assert_num_queries(3):
         response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert response.status_code == 200
@@ -272,25 +253,23 @@ def test_workspacedetail_get_success(rf):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_post_archived_workspace(rf):
+def test_workspacedetail_post_archived_workspace(
+    github_membership_ok, messaged_request
+):
     workspace = WorkspaceFactory(is_archived=True)
 
-    request = rf.post(MEANINGLESS_URL)
-    request.session = "session"
-    request._messages = FallbackStorage(request)
-    request.user = UserFactory()
+    request = messaged_request("post", MEANINGLESS_URL, user=UserFactory())
 
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch("jobserver.views.workspaces.get_actions", return_value=[], autospec=True):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302
     assert response.url == workspace.get_absolute_url()
 
 
 @pytest.mark.django_db
-def test_workspacedetail_post_success(rf, monkeypatch):
+def test_workspacedetail_post_success(
+    rf, monkeypatch, github_membership_ok, dummy_project
+):
     monkeypatch.setenv("BACKENDS", "tpp")
 
     workspace = WorkspaceFactory()
@@ -305,18 +284,7 @@ def test_workspacedetail_post_success(rf, monkeypatch):
     request = rf.post(MEANINGLESS_URL, data)
     request.user = user
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch(
-        "jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml
-    ), patch(
-        "jobserver.views.workspaces.get_branch_sha", new=lambda r, b: "abc123"
-    ):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302, response.context_data["form"].errors
     assert response.url == reverse("workspace-logs", kwargs={"name": workspace.name})
@@ -331,7 +299,9 @@ def test_workspacedetail_post_success(rf, monkeypatch):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_post_with_notifications_default(rf, monkeypatch):
+def test_workspacedetail_post_with_notifications_default(
+    rf, monkeypatch, github_membership_ok, dummy_project
+):
     monkeypatch.setenv("BACKENDS", "tpp")
 
     workspace = WorkspaceFactory(should_notify=True)
@@ -347,18 +317,7 @@ def test_workspacedetail_post_with_notifications_default(rf, monkeypatch):
     request = rf.post(MEANINGLESS_URL, data)
     request.user = user
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch(
-        "jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml
-    ), patch(
-        "jobserver.views.workspaces.get_branch_sha", new=lambda r, b: "abc123"
-    ):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302, response.context_data["form"].errors
     assert response.url == reverse("workspace-logs", kwargs={"name": workspace.name})
@@ -373,7 +332,9 @@ def test_workspacedetail_post_with_notifications_default(rf, monkeypatch):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_post_with_notifications_override(rf, monkeypatch):
+def test_workspacedetail_post_with_notifications_override(
+    rf, monkeypatch, github_membership_ok, dummy_project
+):
     monkeypatch.setenv("BACKENDS", "tpp")
 
     workspace = WorkspaceFactory(should_notify=True)
@@ -389,18 +350,7 @@ def test_workspacedetail_post_with_notifications_override(rf, monkeypatch):
     request = rf.post(MEANINGLESS_URL, data)
     request.user = user
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch(
-        "jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml
-    ), patch(
-        "jobserver.views.workspaces.get_branch_sha", new=lambda r, b: "abc123"
-    ):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302, response.context_data["form"].errors
     assert response.url == reverse("workspace-logs", kwargs={"name": workspace.name})
@@ -416,7 +366,9 @@ def test_workspacedetail_post_with_notifications_override(rf, monkeypatch):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_post_success_with_superuser(rf, monkeypatch, superuser):
+def test_workspacedetail_post_success_with_superuser(
+    rf, monkeypatch, superuser, github_membership_ok, dummy_project
+):
     monkeypatch.setenv("BACKENDS", "tpp,emis")
 
     workspace = WorkspaceFactory()
@@ -432,18 +384,7 @@ def test_workspacedetail_post_success_with_superuser(rf, monkeypatch, superuser)
     request = rf.post(MEANINGLESS_URL, data)
     request.user = user
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch(
-        "jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml
-    ), patch(
-        "jobserver.views.workspaces.get_branch_sha", new=lambda r, b: "abc123"
-    ):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302, response.context_data["form"].errors
     assert response.url == reverse("workspace-logs", kwargs={"name": workspace.name})
@@ -494,7 +435,9 @@ def test_workspacedetail_unknown_workspace(rf):
 
 
 @pytest.mark.django_db
-def test_workspacedetail_get_with_authenticated_user(rf):
+def test_workspacedetail_get_with_authenticated_user(
+    rf, github_membership_ok, dummy_project
+):
     """
     Check GlobalWorkspaceDetail renders the controls for Archiving, Notifications,
     and selecting Actions for authenticated Users.
@@ -505,23 +448,21 @@ def test_workspacedetail_get_with_authenticated_user(rf):
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory(is_superuser=False, roles=[])
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch("jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+
+    # rendered_content renders the template on every access so only do it once
+    content = response.rendered_content
 
-    assert "Archive" in response.rendered_content
-    assert "Turn Notifications" in response.rendered_content
-    assert "twiddle" in response.rendered_content
-    assert "Pick a backend to run your Jobs in" not in response.rendered_content
+    assert "Archive" in content
+    assert "Turn Notifications" in content
+    assert "twiddle" in content
+    assert "Pick a backend to run your Jobs in" not in content
 
 
 @pytest.mark.django_db
-def test_workspacedetail_get_with_superuser(rf, superuser):
+def test_workspacedetail_get_with_superuser(
+    rf, superuser, github_membership_ok, dummy_project
+):
     """Check GlobalWorkspaceDetail renders the Backend radio buttons for superusers"""
     workspace = WorkspaceFactory(is_archived=False)
 
@@ -529,101 +470,85 @@ def test_workspacedetail_get_with_superuser(rf, superuser):
     request = rf.get(MEANINGLESS_URL)
     request.user = superuser
 
-    dummy_yaml = """
-    actions:
-      twiddle:
-    """
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ), patch("jobserver.views.workspaces.get_project", new=lambda *args: dummy_yaml):
-        response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
 
     assert "Pick a backend to run your Jobs in" in response.rendered_content
 
 
 @pytest.mark.django_db
-def test_workspacedetail_get_with_unauthenticated_user(rf):
+def test_workspacedetail_get_with_unauthenticated_user(anon_get_request):
     """
     Check GlobalWorkspaceDetail does not render the controls for Archiving,
     Notifications, and selecting Actions for unauthenticated Users.
     """
     workspace = WorkspaceFactory(is_archived=False)
 
-    # Build a RequestFactory instance
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-    response = GlobalWorkspaceDetail.as_view()(request, name=workspace.name)
+    response = GlobalWorkspaceDetail.as_view()(anon_get_request, name=workspace.name)
+
+    content = response.rendered_content
 
-    assert "Archive" not in response.rendered_content
-    assert "Turn Notifications" not in response.rendered_content
-    assert "twiddle" not in response.rendered_content
+    assert "Archive" not in content
+    assert "Turn Notifications" not in content
+    assert "twiddle" not in content
 
 
 @pytest.mark.django_db
-def test_workspacelog_search_by_action(rf):
+@pytest.mark.parametrize("q,expected", [("run", "run"), ("99", "leap")])
+def test_workspacelog_search(rf, github_membership_ok, q, expected):
     workspace = WorkspaceFactory()
     user = UserFactory()
 
-    job_request1 = JobRequestFactory(created_by=user, workspace=workspace)
-    JobFactory(job_request=job_request1, action="run")
+    run = JobRequestFactory(created_by=user, workspace=workspace)
+    JobFactory(job_request=run, action="run")
+
+    leap = JobRequestFactory(created_by=user, workspace=workspace)
+    JobFactory(job_request=leap, action="leap", id=99)
 
-    job_request2 = JobRequestFactory(workspace=workspace)
-    JobFactory(job_request=job_request2, action="leap")
+    job_requests = {"run": run, "leap": leap}
 
     # Build a RequestFactory instance
-    request = rf.get("/?q=run")
+    request = rf.get(f"/?q={q}")
     request.user = user
 
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ):
-        response = WorkspaceLog.as_view()(request, name=workspace.name)
+    response = WorkspaceLog.as_view()(request, name=workspace.name)
 
     assert len(response.context_data["object_list"]) == 1
-    assert response.context_data["object_list"][0] == job_request1
+    assert response.context_data["object_list"][0] == job_requests[expected]
 
 
 @pytest.mark.django_db
-def test_workspacelog_search_by_id(rf):
+def test_workspacelog_success(rf, github_membership_ok):
     workspace = WorkspaceFactory()
     user = UserFactory()
-
-    JobFactory(job_request=JobRequestFactory())
-
-    job_request2 = JobRequestFactory(created_by=user, workspace=workspace)
-    JobFactory(job_request=job_request2, id=99)
+    job_request = JobRequestFactory(created_by=user, workspace=workspace)
+    JobFactory(job_request=job_request)
 
     # Build a RequestFactory instance
-    request = rf.get("/?q=99")
+    request = rf.get(MEANINGLESS_URL)
     request.user = user
 
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ):
-        response = WorkspaceLog.as_view()(request, name=workspace.name)
+    response = WorkspaceLog.as_view()(request, name=workspace.name)
 
+    assert response.status_code == 200
     assert len(response.context_data["object_list"]) == 1
-    assert response.context_data["object_list"][0] == job_request2
 
 
 @pytest.mark.django_db
-def test_workspacelog_success(rf):
+def test_workspacelog_num_queries(rf, github_membership_ok, django_assert_num_queries):
     workspace = WorkspaceFactory()
-    user = UserFactory()
-    job_request = JobRequestFactory(created_by=user, workspace=workspace)
-    JobFactory(job_request=job_request)
+    for job_request in JobRequestFactory.create_batch(3, workspace=workspace):
+        bulk_create_jobs(2, job_request=job_request)
 
-    # Build a RequestFactory instance
     request = rf.get(MEANINGLESS_URL)
-    request.user = user
+    request.user = UserFactory()
 
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ):
+    # the number of queries shouldn't grow with the JobRequests (or their Jobs)
+    # being listed
+    with django_assert_num_queries(5):
         response = WorkspaceLog.as_view()(request, name=workspace.name)
+        response.render()
 
-    assert response.status_code == 200
-    assert len(response.context_data["object_list"]) == 1
+    assert len(response.context_data["object_list"]) == 3
 
 
 @pytest.mark.django_db
@@ -638,7 +563,7 @@ def test_workspacelog_unknown_workspace(rf):
 
 
 @pytest.mark.django_db
-def test_workspacelog_with_authenticated_user(rf):
+def test_workspacelog_with_authenticated_user(rf, github_membership_ok):
     """
     Check WorkspaceLog renders the Add Job button for authenticated Users
     """
@@ -650,17 +575,14 @@ def test_workspacelog_with_authenticated_user(rf):
     request = rf.get(MEANINGLESS_URL)
     request.user = UserFactory()
 
-    with patch(
-        "jobserver.views.workspaces.can_run_jobs", return_value=True, autospec=True
-    ):
-        response = WorkspaceLog.as_view()(request, name=workspace.name)
+    response = WorkspaceLog.as_view()(request, name=workspace.name)
 
     assert response.status_code == 200
     assert "Add Job" in response.rendered_content
 
 
 @pytest.mark.django_db
-def test_workspacelog_with_unauthenticated_user(rf):
+def test_workspacelog_with_unauthenticated_user(anon_get_request):
     """
     Check WorkspaceLog renders the Add Job button for authenticated Users
     """
@@ -668,27 +590,20 @@ def test_workspacelog_with_unauthenticated_user(rf):
     job_request = JobRequestFactory(workspace=workspace)
     JobFactory(job_request=job_request)
 
-    # Build a RequestFactory instance
-    request = rf.get(MEANINGLESS_URL)
-    request.user = AnonymousUser()
-    response = WorkspaceLog.as_view()(request, name=workspace.name)
+    response = WorkspaceLog.as_view()(anon_get_request, name=workspace.name)
 
     assert response.status_code == 200
     assert "Add Job" not in response.rendered_content
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_workspacenotificationstoggle_success(rf):
+def test_workspacenotificationstoggle_success(rf, github_membership_ok):
     user = UserFactory()
     workspace = WorkspaceFactory(should_notify=True)
 
     request = rf.post(MEANINGLESS_URL, {"should_notify": ""})
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     response = WorkspaceNotificationsToggle.as_view()(request, name=workspace.name)
 
     assert response.status_code == 302
@@ -699,50 +614,34 @@ def test_workspacenotificationstoggle_success(rf):
     assert not workspace.should_notify
 
 
-@pytest.mark.django_db
-@responses.activate
-def test_workspacenotificationstoggle_unauthorized(rf):
-    user = UserFactory()
-    workspace = WorkspaceFactory()
-
+def test_workspacenotificationstoggle_unauthorized(rf, github_membership_forbidden):
     request = rf.post(MEANINGLESS_URL, {"should_notify": ""})
-    request.user = user
+    request.user = UserFactory.build()
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=404)
-
-    response = WorkspaceNotificationsToggle.as_view()(request, name=workspace.name)
+    response = WorkspaceNotificationsToggle.as_view()(request, name="test")
 
     assert response.status_code == 302
     assert response.url == f"{settings.LOGIN_URL}?next=/"
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_workspacenotificationstoggle_unknown_workspace(rf):
+def test_workspacenotificationstoggle_unknown_workspace(rf, github_membership_ok):
     user = UserFactory()
 
     request = rf.post(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=204)
-
     with pytest.raises(Http404):
         WorkspaceNotificationsToggle.as_view()(request, name="test")
 
 
 @pytest.mark.django_db
-@responses.activate
-def test_workspacerelease_unauthorized(rf):
+def test_workspacerelease_unauthorized(rf, github_membership_forbidden):
     user = UserFactory()
 
     request = rf.get(MEANINGLESS_URL)
     request.user = user
 
-    membership_url = f"https://api.github.com/orgs/opensafely/members/{user.username}"
-    responses.add(responses.GET, membership_url, status=404)
-
     response = WorkspaceReleaseView.as_view()(request)
     assert response.status_code == 302
     assert response.url == f"{settings.LOGIN_URL}?next=/"